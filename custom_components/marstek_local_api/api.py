@@ -6,12 +6,26 @@ import json
 import logging
 import random
 import socket
+import struct
+import sys
 import time
+from collections.abc import Iterable
 from copy import deepcopy
 from typing import Any
 
+try:  # orjson ships with Home Assistant; fall back to stdlib json elsewhere
+    import orjson
+except ImportError:  # pragma: no cover - exercised by the standalone test tool
+    orjson = None
+
+try:  # ifaddr is a Home Assistant core dependency (network integration)
+    import ifaddr
+except ImportError:  # pragma: no cover - exercised by the standalone test tool
+    ifaddr = None
+
 from .const import (
     ALL_API_METHODS,
+    BROADCAST_ADDRESS_CACHE_TTL,
     COMMAND_BACKOFF_BASE,
     COMMAND_BACKOFF_FACTOR,
     COMMAND_BACKOFF_JITTER,
@@ -19,7 +33,7 @@ from .const import (
     COMMAND_MAX_ATTEMPTS,
     COMMAND_TIMEOUT,
     DEFAULT_PORT,
-    DISCOVERY_BROADCAST_INTERVAL,
+    DISCOVERY_BROADCAST_SCHEDULE,
     DISCOVERY_TIMEOUT,
     ERROR_METHOD_NOT_FOUND,
     METHOD_BATTERY_STATUS,
@@ -31,6 +45,8 @@ from .const import (
     METHOD_GET_DEVICE,
     METHOD_PV_STATUS,
     METHOD_WIFI_STATUS,
+    UDP_RECEIVE_BUFFER_SIZE,
+    UDP_SEND_BUFFER_SIZE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +57,36 @@ _shared_transports = {}
 _shared_protocols = {}
 _transport_refcounts = {}
 _clients_by_port = {}  # Map port -> list of clients
+_connect_lock = asyncio.Lock()
+
+_MSG_ID_WRAP = 1000000  # Message ids stay below this value
+_MIN_MESSAGE_SIZE = 8  # Bytes in the smallest possible reply, '{"id":0}'
+_EXECUTOR_DECODE_THRESHOLD = 4096  # Bytes; larger frames are decoded off the event loop
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes (stdlib fallback)."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Discovery request is constant; encode it once and reuse for every broadcast
+_DISCOVERY_PAYLOAD: bytes = _json_dumps({
+    "id": 0,
+    "method": METHOD_GET_DEVICE,
+    "params": {"ble_mac": "0"},
+})
+
+
+def _expire_future(future: asyncio.Future) -> None:
+    """Fail a pending response future with a timeout (call_later callback)."""
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
 
 
 class MarstekUDPClient:
@@ -61,76 +107,98 @@ class MarstekUDPClient:
         self.remote_port = remote_port or DEFAULT_PORT
         self.transport: asyncio.DatagramTransport | None = None
         self.protocol: MarstekProtocol | None = None
-        self._handlers: list = []
+        # In-flight commands keyed by message id; resolved directly on receipt
+        self._pending: dict[int, asyncio.Future] = {}
+        # Discovery/broadcast handlers, created on first registration
+        self._broadcast_handlers: list | None = None
         self._connected = False
         self._stale_message_counter = 0
         self._command_stats: dict[str, dict[str, Any]] = {}
-        self._msg_id_counter = 0  # Counter for integer message IDs
+        # Counter for integer message IDs; random start so clients talking to the
+        # same device (e.g. config flow and coordinator) don't reuse each other's ids
+        self._msg_id_counter = random.randrange(1, _MSG_ID_WRAP)
+        self._bcast_cache: tuple[float, list[str]] | None = None  # (monotonic ts, addresses)
+        self._closed_event: asyncio.Event | None = None  # Socket close we're responsible for
+        # Minimum spacing (seconds) between requests sent to the device; 0 disables pacing
+        self.send_interval = 0.0
+        self._next_send_at = 0.0  # Monotonic time the next request may be sent
 
     async def connect(self) -> None:
         """Connect to the UDP socket."""
-        if self._connected and self.transport:
-            _LOGGER.debug("Already connected on port %s", self.port)
-            return
+        # Serialize connects so concurrent callers can't create duplicate endpoints
+        async with _connect_lock:
+            if self._connected and self.transport:
+                _LOGGER.debug("Already connected on port %s", self.port)
+                return
 
-        loop = asyncio.get_event_loop()
-        self._loop = loop
+            loop = asyncio.get_event_loop()
+            self._loop = loop
 
-        _LOGGER.info(
-            "Connecting UDP socket: local_port=%s, remote_host=%s, remote_port=%s",
-            self.port, self.host or "broadcast", self.remote_port
-        )
-
-        try:
-            # Use shared transport/protocol for this port to ensure all clients
-            # on the same port can receive all UDP messages
-            if self.port not in _shared_transports:
-                # Create shared UDP endpoint for this port
-                import sys
-                endpoint_kwargs = {
-                    "local_addr": ("0.0.0.0", self.port),
-                    "allow_broadcast": True,
-                }
-                # reuse_port is not supported on Windows
-                if sys.platform != "win32":
-                    endpoint_kwargs["reuse_port"] = True
-                transport, protocol = await loop.create_datagram_endpoint(
-                    lambda: MarstekProtocol(),
-                    **endpoint_kwargs,
-                )
-                _shared_transports[self.port] = transport
-                _shared_protocols[self.port] = protocol
-                _transport_refcounts[self.port] = 0
+            _LOGGER.info(
+                "Connecting UDP socket: local_port=%s, remote_host=%s, remote_port=%s",
+                self.port, self.host or "broadcast", self.remote_port
+            )
 
-                _LOGGER.info(
-                    "Created shared UDP socket on port %s",
-                    self.port
-                )
+            try:
+                # Use shared transport/protocol for this port to ensure all clients
+                # on the same port can receive all UDP messages
+                if self.port not in _shared_transports:
+                    # Create shared UDP endpoint for this port
+                    endpoint_kwargs = {
+                        "local_addr": ("0.0.0.0", self.port),
+                        "allow_broadcast": True,
+                    }
+                    # reuse_port is not supported on Windows
+                    if sys.platform != "win32":
+                        endpoint_kwargs["reuse_port"] = True
+                    transport, protocol = await loop.create_datagram_endpoint(
+                        lambda: MarstekProtocol(),
+                        **endpoint_kwargs,
+                    )
+                    # Enlarge the receive buffer so discovery bursts aren't dropped by the kernel
+                    sock = transport.get_extra_info('socket')
+                    if sock is not None:
+                        for option, size in (
+                            (socket.SO_RCVBUF, UDP_RECEIVE_BUFFER_SIZE),
+                            (socket.SO_SNDBUF, UDP_SEND_BUFFER_SIZE),
+                        ):
+                            try:
+                                sock.setsockopt(socket.SOL_SOCKET, option, size)
+                            except OSError as err:
+                                _LOGGER.debug("Could not set socket buffer on port %s: %s", self.port, err)
+                    _shared_transports[self.port] = transport
+                    _shared_protocols[self.port] = protocol
+                    _transport_refcounts[self.port] = 0
+
+                    _LOGGER.info(
+                        "Created shared UDP socket on port %s",
+                        self.port
+                    )
 
-            # Use the shared transport/protocol
-            self.transport = _shared_transports[self.port]
-            self.protocol = _shared_protocols[self.port]
-            _transport_refcounts[self.port] += 1
+                # Use the shared transport/protocol
+                self.transport = _shared_transports[self.port]
+                self.protocol = _shared_protocols[self.port]
+                _transport_refcounts[self.port] += 1
 
-            # Register this client for message dispatching
-            if self.port not in _clients_by_port:
-                _clients_by_port[self.port] = []
-            if self not in _clients_by_port[self.port]:
-                _clients_by_port[self.port].append(self)
+                # Register this client for message dispatching
+                if self.port not in _clients_by_port:
+                    _clients_by_port[self.port] = []
+                if self not in _clients_by_port[self.port]:
+                    _clients_by_port[self.port].append(self)
 
-            self._connected = True
-            sock = self.transport.get_extra_info('socket')
-            _LOGGER.info(
-                "UDP socket connected: local_port=%s, socket=%s, refcount=%d, clients=%d",
-                self.port, sock.getsockname() if sock else "unknown",
-                _transport_refcounts[self.port], len(_clients_by_port[self.port])
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to connect UDP socket on port %s: %s",
-                self.port, err, exc_info=True
-            )
-            raise
+                self._connected = True
+                sock = self.transport.get_extra_info('socket')
+                _LOGGER.info(
+                    "UDP socket connected: local_port=%s, socket=%s, refcount=%d, clients=%d",
+                    self.port, sock.getsockname() if sock else "unknown",
+                    _transport_refcounts[self.port], len(_clients_by_port[self.port])
+                )
+            except Exception as err:
+                _LOGGER.error(
+                    "Failed to connect UDP socket on port %s: %s",
+                    self.port, err, exc_info=True
+                )
+                raise
 
     async def disconnect(self) -> None:
         """Disconnect from the UDP socket."""
@@ -147,6 +215,8 @@ class MarstekUDPClient:
             # Only close the shared transport when last client disconnects
             if _transport_refcounts[self.port] <= 0:
                 if self.transport:
+                    if self.protocol:
+                        self._closed_event = self.protocol.closed
                     try:
                         self.transport.close()
                     except Exception as err:
@@ -171,45 +241,78 @@ class MarstekUDPClient:
         self.protocol = None
         self._connected = False
 
+    async def wait_closed(self) -> None:
+        """Wait until the socket closed by the last disconnect() has been released.
+
+        Returns immediately if this client's disconnect did not close the
+        shared socket (other clients still use it) or never connected.
+        """
+        event = self._closed_event
+        if event is not None:
+            await event.wait()
+            self._closed_event = None
+
     def register_handler(self, handler) -> None:
         """Register a message handler."""
-        if handler not in self._handlers:
-            self._handlers.append(handler)
+        if self._broadcast_handlers is None:
+            self._broadcast_handlers = []
+        if handler not in self._broadcast_handlers:
+            self._broadcast_handlers.append(handler)
 
     def unregister_handler(self, handler) -> None:
         """Unregister a message handler."""
-        if handler in self._handlers:
-            self._handlers.remove(handler)
-
-    async def _handle_message(self, data: bytes, addr: tuple) -> None:
-        """Handle incoming UDP message.
-
-        This method is called by the shared protocol and needs to dispatch
-        the message to all clients sharing this port.
+        if self._broadcast_handlers and handler in self._broadcast_handlers:
+            self._broadcast_handlers.remove(handler)
+            if not self._broadcast_handlers:
+                # Back to the command-only fast path once discovery is done
+                self._broadcast_handlers = None
+
+    def _handle_message(self, message: dict, addr: tuple) -> None:
+        """Handle an incoming UDP message.
+
+        The shared protocol decodes each datagram once and hands the parsed
+        message to every client sharing this port. Command responses are
+        resolved through the pending table; anything else goes to the
+        registered broadcast handlers. This runs synchronously from
+        datagram_received; a task is only created for async handlers.
         """
-        try:
-            message = json.loads(data.decode())
-            _LOGGER.debug(
-                "Received UDP message from %s:%s (size=%d bytes): %s",
-                addr[0], addr[1], len(data), message
-            )
+        msg_id = message.get("id")
+        response_future = self._pending.get(msg_id)
+        if response_future is not None:
+            if self.host and addr[0] != self.host:
+                _LOGGER.debug("Ignoring response from wrong host: %s (expected %s)", addr[0], self.host)
+            elif not response_future.done():
+                _LOGGER.debug("Matched response for id=%s from %s", msg_id, addr)
+                response_future.set_result(message)
+                return
+        elif self._pending:
+            # Track stray messages so we know if queues are backing up
+            self._stale_message_counter += 1
+            if self._stale_message_counter <= 5 or self._stale_message_counter % 25 == 0:
+                _LOGGER.debug(
+                    "Ignoring stale message while waiting for %d command(s): got id=%s from %s (total stales=%d)",
+                    len(self._pending),
+                    msg_id,
+                    addr[0],
+                    self._stale_message_counter,
+                )
 
-            # Call all registered handlers from THIS client
-            handlers_called = 0
-            for handler in self._handlers:
-                try:
-                    # Handler can be sync or async
-                    result = handler(message, addr)
-                    if asyncio.iscoroutine(result):
-                        await result
-                    handlers_called += 1
-                except Exception as err:
-                    _LOGGER.error("Error in message handler: %s", err, exc_info=True)
+        if not self._broadcast_handlers:
+            return
 
-            _LOGGER.debug("Called %d handler(s) for message from %s", handlers_called, addr[0])
+        # Call all registered handlers from THIS client
+        handlers_called = 0
+        for handler in self._broadcast_handlers:
+            try:
+                # Handler can be sync or async
+                result = handler(message, addr)
+                if asyncio.iscoroutine(result):
+                    self._loop.create_task(result)
+                handlers_called += 1
+            except Exception as err:
+                _LOGGER.error("Error in message handler: %s", err, exc_info=True)
 
-        except json.JSONDecodeError as err:
-            _LOGGER.error("Failed to decode JSON message from %s: %s (data: %s)", addr, err, data[:200])
+        _LOGGER.debug("Called %d handler(s) for message from %s", handlers_called, addr[0])
 
     async def send_command(
         self,
@@ -229,60 +332,35 @@ class MarstekUDPClient:
         attempt_limit = max_attempts if max_attempts is not None else COMMAND_MAX_ATTEMPTS
 
         # Generate unique integer message ID (required for Venus E firmware V139+)
-        self._msg_id_counter = (self._msg_id_counter + 1) % 1000000  # Wrap at 1 million
+        # Wrap below 1 million, skipping 0 which is reserved for discovery
+        self._msg_id_counter = self._msg_id_counter % (_MSG_ID_WRAP - 1) + 1
         msg_id = self._msg_id_counter
         payload = {
             "id": msg_id,
             "method": method,
             "params": params,
         }
-        payload_str = json.dumps(payload)
+        payload_bytes = _json_dumps(payload)
 
         _LOGGER.debug(
             "Sending command: method=%s, id=%s, host=%s, port=%s, transport=%s",
             method, msg_id, self.host, self.remote_port, self.transport is not None
         )
 
-        # Shared response tracking for all attempts
-        response_event = asyncio.Event()
-        response_data: dict[str, Any] = {}
         last_exception: Exception | None = None
 
-        # Allow the event loop to process any pending datagrams before we start
-        await asyncio.sleep(0)
-
-        def handler(message, addr):
-            """Handle command response."""
-            if message.get("id") == msg_id:
-                if self.host and addr[0] != self.host:
-                    _LOGGER.debug("Ignoring response from wrong host: %s (expected %s)", addr[0], self.host)
-                    return  # Wrong device
-                _LOGGER.debug("Matched response for %s from %s", method, addr)
-                response_data.clear()
-                response_data.update(message)
-                response_event.set()
-            else:
-                # Track stray messages so we know if queues are backing up
-                self._stale_message_counter += 1
-                if self._stale_message_counter <= 5 or self._stale_message_counter % 25 == 0:
-                    _LOGGER.debug(
-                        "Ignoring stale message while waiting for %s: got id=%s from %s (total stales=%d)",
-                        method,
-                        message.get("id"),
-                        addr[0],
-                        self._stale_message_counter,
-                    )
-
-        # Register temporary handler
-        self.register_handler(handler)
-
         try:
             loop = asyncio.get_running_loop()
 
             for attempt in range(1, attempt_limit + 1):
-                response_event.clear()
-                response_data.clear()
+                # Paced before the timeout starts so waiting for a slot doesn't count
+                await self._wait_send_slot()
+                # A future resolves only once, so each attempt gets a fresh one;
+                # the timer fails it with TimeoutError if no response arrives
+                response_future = loop.create_future()
+                self._pending[msg_id] = response_future
                 attempt_started = loop.time()
+                timeout_handle = loop.call_later(effective_timeout, _expire_future, response_future)
 
                 try:
                     _LOGGER.debug(
@@ -291,13 +369,11 @@ class MarstekUDPClient:
                         attempt_limit,
                         self.host or "broadcast",
                         self.remote_port,
-                        payload_str,
+                        payload_bytes,
                     )
-                    # Yield once more to ensure pending packets are processed before sending
-                    await asyncio.sleep(0)
-                    await self._send_to_host(payload_str)
+                    await self._send_to_host(payload_bytes)
 
-                    await asyncio.wait_for(response_event.wait(), timeout=effective_timeout)
+                    response_data = await response_future
 
                     if "error" in response_data:
                         error = response_data["error"]
@@ -377,6 +453,8 @@ class MarstekUDPClient:
                         exc_info=True,
                     )
                     last_exception = err
+                finally:
+                    timeout_handle.cancel()
 
                 if attempt < attempt_limit:
                     delay = self._compute_backoff_delay(attempt)
@@ -390,7 +468,7 @@ class MarstekUDPClient:
                     await asyncio.sleep(delay)
 
         finally:
-            self.unregister_handler(handler)
+            self._pending.pop(msg_id, None)
 
         if last_exception:
             raise last_exception
@@ -402,7 +480,26 @@ class MarstekUDPClient:
         )
         return None
 
-    async def _send_to_host(self, message: str) -> None:
+    async def _wait_send_slot(self) -> None:
+        """Wait for this client's next send slot and reserve it.
+
+        Slots are ``send_interval`` apart, counted from the previous request,
+        so only a request following another within that interval waits; the
+        first request after a quiet period goes out immediately.
+        """
+        if not self.send_interval and not self._next_send_at:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_send_at)
+        self._next_send_at = slot + self.send_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def defer_sends(self, until: float) -> None:
+        """Hold back the next request until at least the monotonic time ``until``."""
+        self._next_send_at = max(self._next_send_at, until)
+
+    async def _send_to_host(self, message: bytes) -> None:
         """Send message to specific host or broadcast."""
         if not self.transport:
             raise MarstekAPIError("Not connected")
@@ -410,7 +507,7 @@ class MarstekUDPClient:
         if self.host:
             # Send to specific host on remote port
             self.transport.sendto(
-                message.encode(),
+                message,
                 (self.host, self.remote_port)
             )
         else:
@@ -493,6 +590,17 @@ class MarstekUDPClient:
             return None
         return dict(stats)
 
+    def get_command_stats_for(self, methods: Iterable[str]) -> dict[str, dict[str, Any] | None]:
+        """Return snapshots of several commands' statistics, taken together.
+
+        Never-attempted commands map to None, as with get_command_stats.
+        """
+        command_stats = self._command_stats
+        return {
+            method: dict(stats) if (stats := command_stats.get(method)) is not None else None
+            for method in methods
+        }
+
     def get_all_command_stats(self) -> dict[str, dict[str, Any]]:
         """Return snapshot of all command statistics including never-attempted commands."""
         all_stats = {}
@@ -520,7 +628,7 @@ class MarstekUDPClient:
                 }
         return all_stats
 
-    async def broadcast(self, message: str) -> None:
+    async def broadcast(self, message: bytes) -> None:
         """Broadcast a message."""
         if not self.transport:
             await self.connect()
@@ -529,7 +637,7 @@ class MarstekUDPClient:
         broadcast_addr = self._get_broadcast_address()
 
         self.transport.sendto(
-            message.encode(),
+            message,
             (broadcast_addr, self.remote_port)
         )
         _LOGGER.debug("Broadcast message: %s", message)
@@ -537,23 +645,72 @@ class MarstekUDPClient:
     def _get_broadcast_addresses(self) -> list[str]:
         """Get all broadcast addresses for available networks.
 
+        Interfaces are enumerated with ifaddr when available, falling back to
+        parsing ifconfig. The result is cached for BROADCAST_ADDRESS_CACHE_TTL
+        seconds so repeated broadcasts don't re-scan the interfaces.
+        """
+        now = time.monotonic()
+        if self._bcast_cache is not None and now - self._bcast_cache[0] < BROADCAST_ADDRESS_CACHE_TTL:
+            return list(self._bcast_cache[1])
+
+        if ifaddr is not None:
+            broadcast_addrs = self._get_adapter_broadcast_addresses()
+        else:
+            broadcast_addrs = self._parse_ifconfig_broadcast_addresses()
+
+        # If we found nothing, use global broadcast as fallback
+        if not broadcast_addrs:
+            broadcast_addrs.add(0xffffffff)
+
+        # Deduplicated as integers; format each address once, in a stable order
+        addresses = [socket.inet_ntoa(struct.pack('>I', value)) for value in sorted(broadcast_addrs)]
+        self._bcast_cache = (now, addresses)
+        return list(addresses)
+
+    @staticmethod
+    def _get_adapter_broadcast_addresses() -> set[int]:
+        """Compute broadcast addresses (as u32 ints) from the IPv4 interfaces reported by ifaddr."""
+        broadcast_addrs: set[int] = set()
+
+        try:
+            for adapter in ifaddr.get_adapters():
+                for adapter_ip in adapter.ips:
+                    if not adapter_ip.is_IPv4:
+                        continue
+                    ip = adapter_ip.ip
+                    prefix = adapter_ip.network_prefix
+
+                    # Skip loopback and point-to-point /32 (VPN) interfaces
+                    if ip.startswith('127.') or prefix >= 32:
+                        continue
+
+                    ip_int = struct.unpack('>I', socket.inet_aton(ip))[0]
+                    host_mask = 0xffffffff >> prefix
+                    broadcast_addrs.add(ip_int | host_mask)
+        except (OSError, ValueError) as err:
+            _LOGGER.debug("Could not enumerate network adapters: %s, using fallback", err)
+
+        return broadcast_addrs
+
+    @staticmethod
+    def _parse_ifconfig_broadcast_addresses() -> set[int]:
+        """Get broadcast addresses (as u32 ints) by parsing ifconfig output.
+
         Uses simple heuristic: broadcast on /24 of primary interface and global broadcast.
         This works for most home networks and avoids VPN interfaces.
         """
-        import struct
         import subprocess
 
-        broadcast_addrs = set()
+        broadcast_ints: set[int] = set()
 
         try:
             # Parse ifconfig to get all network interfaces and their IPs
             result = subprocess.run(['ifconfig'], capture_output=True, text=True, timeout=2)
-            current_ip = None
 
             for line in result.stdout.split('\n'):
                 # Parse inet lines
                 if '\tinet ' in line:
-                    parts = line.strip().split()
+                    parts = line.split()
                     if len(parts) >= 2 and parts[0] == 'inet':
                         ip = parts[1]
 
@@ -561,8 +718,13 @@ class MarstekUDPClient:
                         if ip.startswith('127.'):
                             continue
 
-                        # Parse netmask if present
-                        netmask = None
+                        try:
+                            ip_int = struct.unpack('>I', socket.inet_aton(ip))[0]
+                        except OSError:
+                            continue
+
+                        # Parse hex netmask if present (e.g. 0xffffff00)
+                        mask_int = None
                         if 'netmask' in parts:
                             idx = parts.index('netmask')
                             if idx + 1 < len(parts):
@@ -570,43 +732,45 @@ class MarstekUDPClient:
                                 # Skip point-to-point /32 (VPN) interfaces
                                 if mask_hex == '0xffffffff':
                                     continue
-
-                                # Convert hex netmask to dotted decimal
                                 try:
                                     mask_int = int(mask_hex, 16)
-                                    netmask = socket.inet_ntoa(struct.pack('>I', mask_int))
-                                except (ValueError, OSError):
+                                except ValueError:
                                     pass
 
                         # Check for explicit broadcast address
                         if 'broadcast' in parts:
                             idx = parts.index('broadcast')
                             if idx + 1 < len(parts):
-                                broadcast_addrs.add(parts[idx + 1])
-                        elif netmask:
+                                try:
+                                    broadcast_ints.add(struct.unpack('>I', socket.inet_aton(parts[idx + 1]))[0])
+                                except OSError:
+                                    pass
+                        elif mask_int is not None:
                             # Calculate broadcast address
-                            try:
-                                ip_int = struct.unpack('>I', socket.inet_aton(ip))[0]
-                                mask_int = struct.unpack('>I', socket.inet_aton(netmask))[0]
-                                broadcast_int = ip_int | (~mask_int & 0xffffffff)
-                                broadcast = socket.inet_ntoa(struct.pack('>I', broadcast_int))
-                                broadcast_addrs.add(broadcast)
-                            except (ValueError, OSError):
-                                pass
+                            broadcast_ints.add((ip_int | ~mask_int) & 0xffffffff)
                         else:
                             # Assume /24 network
-                            parts_ip = ip.split(".")
-                            if len(parts_ip) == 4:
-                                broadcast_addrs.add(f"{parts_ip[0]}.{parts_ip[1]}.{parts_ip[2]}.255")
+                            broadcast_ints.add(ip_int | 0xff)
 
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as err:
             _LOGGER.debug("Could not parse ifconfig: %s, using fallback", err)
 
-        # If we found nothing, use global broadcast as fallback
-        if not broadcast_addrs:
-            broadcast_addrs.add("255.255.255.255")
+        return broadcast_ints
+
+    def _send_to_addresses(self, message: bytes, addresses: list[str]) -> None:
+        """Send the same datagram to every address in one pass.
+
+        DatagramTransport.sendto never blocks: the datagram is either handed
+        to the kernel or queued by the transport, so the fan-out stays on the
+        event loop without awaiting anything.
+        """
+        transport = self.transport
+        if transport is None:
+            return
 
-        return list(broadcast_addrs)
+        remote_port = self.remote_port
+        for address in addresses:
+            transport.sendto(message, (address, remote_port))
 
     def _get_broadcast_address(self) -> str:
         """Get primary broadcast address (for backward compatibility)."""
@@ -668,27 +832,23 @@ class MarstekUDPClient:
             broadcast_addrs = self._get_broadcast_addresses()
             _LOGGER.debug("Broadcasting to networks: %s", broadcast_addrs)
 
-            # Broadcast discovery message repeatedly on all networks
-            end_time = asyncio.get_event_loop().time() + timeout
-            message = json.dumps({
-                "id": 0,
-                "method": METHOD_GET_DEVICE,
-                "params": {"ble_mac": "0"}
-            })
+            # Broadcast a few times early in the window, then just listen
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            end_time = start_time + timeout
 
-            while asyncio.get_event_loop().time() < end_time:
+            for offset in DISCOVERY_BROADCAST_SCHEDULE:
+                delay = start_time + offset - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
                 # Broadcast to all networks
-                for broadcast_addr in broadcast_addrs:
-                    if self.transport:
-                        self.transport.sendto(
-                            message.encode(),
-                            (broadcast_addr, self.remote_port)
-                        )
-                await asyncio.sleep(DISCOVERY_BROADCAST_INTERVAL)
+                self._send_to_addresses(_DISCOVERY_PAYLOAD, broadcast_addrs)
 
-            # Wait a bit longer for any delayed responses
+            # Wait for responses until the discovery window closes
             _LOGGER.debug("Waiting for delayed responses...")
-            await asyncio.sleep(2)
+            remaining = end_time - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
 
         finally:
             self.unregister_handler(handler)
@@ -824,6 +984,11 @@ class MarstekProtocol(asyncio.DatagramProtocol):
     def __init__(self) -> None:
         """Initialize the protocol."""
         self.port = None  # Will be set when socket is bound
+        self.closed = asyncio.Event()  # Set once the socket has actually closed
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Signal that the shared socket has closed."""
+        self.closed.set()
 
     def datagram_received(self, data: bytes, addr: tuple) -> None:
         """Handle received datagram.
@@ -844,11 +1009,56 @@ class MarstekProtocol(asyncio.DatagramProtocol):
 
         # Dispatch to all clients on this port
         if self.port and self.port in _clients_by_port:
-            for client in _clients_by_port[self.port]:
-                asyncio.create_task(client._handle_message(data, addr))
+            # Cheap pre-check: device replies are JSON objects, drop other LAN noise unparsed
+            if len(data) < _MIN_MESSAGE_SIZE or data[0] != 0x7B:  # "{"
+                _LOGGER.debug("Ignoring non-JSON datagram from %s (size=%d bytes)", addr[0], len(data))
+                return
+
+            if len(data) > _EXECUTOR_DECODE_THRESHOLD:
+                # Decode unusually large frames in a worker thread to keep the loop responsive
+                decode = asyncio.get_running_loop().run_in_executor(None, _json_loads, data)
+                decode.add_done_callback(
+                    lambda future: self._dispatch_decoded(future, data, addr)
+                )
+                return
+
+            # Decode once here rather than once per client sharing the socket
+            try:
+                message = _json_loads(data)
+            except json.JSONDecodeError as err:
+                _LOGGER.error("Failed to decode JSON message from %s: %s (data: %s)", addr, err, data[:200])
+                return
+
+            self._dispatch(message, data, addr)
         else:
             _LOGGER.warning("Received message but no clients registered for port %s", self.port)
 
+    def _dispatch_decoded(self, future: asyncio.Future, data: bytes, addr: tuple) -> None:
+        """Dispatch a message decoded in the executor."""
+        if future.cancelled():
+            return
+        try:
+            message = future.result()
+        except json.JSONDecodeError as err:
+            _LOGGER.error("Failed to decode JSON message from %s: %s (data: %s)", addr, err, data[:200])
+            return
+
+        self._dispatch(message, data, addr)
+
+    def _dispatch(self, message: dict, data: bytes, addr: tuple) -> None:
+        """Hand a decoded message to the clients on this port it concerns."""
+        _LOGGER.debug(
+            "Received UDP message from %s:%s (size=%d bytes): %s",
+            addr[0], addr[1], len(data), message
+        )
+
+        # Clients bound to a device only see that device's traffic; host-less
+        # clients and clients listening for broadcasts (discovery) see everything.
+        host = addr[0]
+        for client in _clients_by_port.get(self.port, ()):
+            if not client.host or client.host == host or client._broadcast_handlers:
+                client._handle_message(message, addr)
+
     def error_received(self, exc: Exception) -> None:
         """Handle protocol errors."""
         _LOGGER.error("Protocol error: %s", exc)
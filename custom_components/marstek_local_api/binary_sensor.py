@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -22,7 +23,11 @@ from .const import (
     DATA_COORDINATOR,
     DOMAIN,
 )
-from .coordinator import MarstekDataUpdateCoordinator, MarstekMultiDeviceCoordinator
+from .coordinator import (
+    MarstekDataUpdateCoordinator,
+    MarstekMultiDeviceCoordinator,
+    build_device_info,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +38,10 @@ class MarstekBinarySensorEntityDescription(BinarySensorEntityDescription):
 
     value_fn: Callable[[dict], bool] | None = None
     available_fn: Callable[[dict], bool] | None = None
+    # Nested data lookup, e.g. ("battery", "charg_flag"); takes precedence over value_fn
+    path: tuple[str, ...] | None = None
+    # Value the looked-up field must equal to be "on" (None = use truthiness)
+    equals: Any = None
 
 
 BINARY_SENSOR_TYPES: tuple[MarstekBinarySensorEntityDescription, ...] = (
@@ -41,30 +50,58 @@ BINARY_SENSOR_TYPES: tuple[MarstekBinarySensorEntityDescription, ...] = (
         key="charging_enabled",
         name="Charging enabled",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-        value_fn=lambda data: data.get("battery", {}).get("charg_flag", False),
+        path=("battery", "charg_flag"),
     ),
     MarstekBinarySensorEntityDescription(
         key="discharging_enabled",
         name="Discharging enabled",
-        value_fn=lambda data: data.get("battery", {}).get("dischrg_flag", False),
+        path=("battery", "dischrg_flag"),
     ),
     # Bluetooth connection
     MarstekBinarySensorEntityDescription(
         key="bluetooth_connected",
         name="Bluetooth connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: data.get("ble", {}).get("state") == BLE_STATE_CONNECT,
+        path=("ble", "state"),
+        equals=BLE_STATE_CONNECT,
     ),
     # CT connection
     MarstekBinarySensorEntityDescription(
         key="ct_connected",
         name="CT connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: data.get("em", {}).get("ct_state") == CT_STATE_CONNECTED,
+        path=("em", "ct_state"),
+        equals=CT_STATE_CONNECTED,
     ),
 )
 
 
+# Shared stand-in for missing sections so lookups never allocate
+_EMPTY: dict = {}
+
+
+def _walk(data: dict | None, path: tuple[str, ...]) -> Any:
+    """Return the value at path in nested device data, or None if missing."""
+    value: Any = data
+    for key in path:
+        value = (value or _EMPTY).get(key)
+    return value
+
+
+def _read_is_on(description: MarstekBinarySensorEntityDescription, data: dict | None) -> bool | None:
+    """Evaluate a binary sensor description against device data."""
+    if description.path is None:
+        if description.value_fn:
+            return description.value_fn(data)
+        return None
+
+    # Missing section or field reads as "off"
+    value = _walk(data, description.path)
+    if description.equals is not None:
+        return value == description.equals
+    return bool(value)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -80,7 +117,7 @@ async def async_setup_entry(
         # Multi-device mode - create binary sensors for each device
         for mac in coordinator.get_device_macs():
             device_coordinator = coordinator.device_coordinators[mac]
-            device_data = next(d for d in coordinator.devices if (d.get("ble_mac") or d.get("wifi_mac")) == mac)
+            device_info = coordinator.device_infos[mac]
 
             for description in BINARY_SENSOR_TYPES:
                 entities.append(
@@ -89,17 +126,21 @@ async def async_setup_entry(
                         device_coordinator=device_coordinator,
                         entity_description=description,
                         device_mac=mac,
-                        device_data=device_data,
+                        device_info=device_info,
                     )
                 )
     else:
         # Single device mode (legacy)
+        device_mac = entry.data.get("ble_mac") or entry.data.get("wifi_mac")
+        device_info = build_device_info(device_mac, entry.data)
+
         for description in BINARY_SENSOR_TYPES:
             entities.append(
                 MarstekBinarySensor(
                     coordinator=coordinator,
                     entity_description=description,
-                    entry=entry,
+                    device_mac=device_mac,
+                    device_info=device_info,
                 )
             )
 
@@ -115,28 +156,20 @@ class MarstekBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self,
         coordinator: MarstekDataUpdateCoordinator,
         entity_description: MarstekBinarySensorEntityDescription,
-        entry: ConfigEntry,
+        device_mac: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._attr_has_entity_name = True
-        device_mac = entry.data.get("ble_mac") or entry.data.get("wifi_mac")
         self._attr_unique_id = f"{device_mac}_{entity_description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_mac)},
-            name=f"Marstek {entry.data['device']}",
-            manufacturer="Marstek",
-            model=entry.data["device"],
-            sw_version=str(entry.data.get("firmware", "Unknown")),
-        )
+        self._attr_device_info = device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.entity_description.value_fn:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return None
+        return _read_is_on(self.entity_description, self.coordinator.data)
 
     @property
     def available(self) -> bool:
@@ -158,7 +191,7 @@ class MarstekMultiDeviceBinarySensor(CoordinatorEntity, BinarySensorEntity):
         device_coordinator: MarstekDataUpdateCoordinator,
         entity_description: MarstekBinarySensorEntityDescription,
         device_mac: str,
-        device_data: dict,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
@@ -167,25 +200,15 @@ class MarstekMultiDeviceBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self.device_mac = device_mac
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{device_mac}_{entity_description.key}"
-
-        # Extract last 4 chars of MAC for device name differentiation
-        mac_suffix = device_mac.replace(":", "")[-4:]
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_mac)},
-            name=f"Marstek {device_data.get('device', 'Device')} {mac_suffix}",
-            manufacturer="Marstek",
-            model=device_data.get("device", "Unknown"),
-            sw_version=str(device_data.get("firmware", "Unknown")),
-        )
+        self._attr_device_info = device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.entity_description.value_fn:
-            device_data = self.coordinator.get_device_data(self.device_mac)
-            return self.entity_description.value_fn(device_data)
-        return None
+        return _read_is_on(
+            self.entity_description,
+            self.coordinator.get_device_data(self.device_mac),
+        )
 
     @property
     def available(self) -> bool:
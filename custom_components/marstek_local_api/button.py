@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator
 import logging
+import random
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
 from .const import (
     DATA_COORDINATOR,
@@ -19,9 +22,16 @@ from .const import (
     MODE_AI,
     MODE_AUTO,
     MODE_MANUAL,
+    Mode,
     RETRY_DELAY,
+    RETRY_DELAY_JITTER,
+    RETRY_DELAY_MAX,
+)
+from .coordinator import (
+    MarstekDataUpdateCoordinator,
+    MarstekMultiDeviceCoordinator,
+    build_device_info,
 )
-from .coordinator import MarstekDataUpdateCoordinator, MarstekMultiDeviceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,20 +45,66 @@ DEFAULT_MANUAL_MODE_CFG: dict[str, int | str] = {
 }
 
 
-def _mode_state_from_config(mode: str, config: dict) -> dict:
+# Per-mode (config key, payload). Payloads are constant; they are only read
+# (never mutated) when sent and when copied into the coordinator cache, so one
+# shared dict per mode is safe
+_MODE_TABLE: dict[Mode, tuple[str, dict]] = {
+    Mode.AUTO: ("auto_cfg", {
+        "mode": MODE_AUTO,
+        "auto_cfg": {"enable": 1},
+    }),
+    Mode.AI: ("ai_cfg", {
+        "mode": MODE_AI,
+        "ai_cfg": {"enable": 1},
+    }),
+    Mode.MANUAL: ("manual_cfg", {
+        "mode": MODE_MANUAL,
+        "manual_cfg": DEFAULT_MANUAL_MODE_CFG,
+    }),
+}
+
+
+# (mode, entity name, icon) for each mode button created per device
+_MODE_SPECS: tuple[tuple[Mode, str, str], ...] = (
+    (Mode.AUTO, "Auto mode", "mdi:auto-mode"),
+    (Mode.AI, "AI mode", "mdi:brain"),
+    (Mode.MANUAL, "Manual mode", "mdi:calendar-clock"),
+)
+
+# Lowercase mode names used in button unique IDs
+_MODE_LOWER: dict[Mode, str] = {mode: mode.wire.lower() for mode in _MODE_TABLE}
+
+# Coalesce optimistic cache writes that land within this window (seconds)
+MODE_CACHE_COOLDOWN = 0.3
+
+
+def _mode_state_from_config(mode: Mode, config: dict) -> dict:
     """Extract mode state information from a config payload."""
-    state: dict[str, object] = {"mode": mode}
+    state: dict[str, object] = {"mode": mode.wire}
 
-    if mode == MODE_AUTO and "auto_cfg" in config:
-        state["auto_cfg"] = dict(config["auto_cfg"])
-    elif mode == MODE_AI and "ai_cfg" in config:
-        state["ai_cfg"] = dict(config["ai_cfg"])
-    elif mode == MODE_MANUAL and "manual_cfg" in config:
-        state["manual_cfg"] = dict(config["manual_cfg"])
+    entry = _MODE_TABLE.get(mode)
+    if entry is not None:
+        cfg_key = entry[0]
+        if cfg_key in config:
+            state[cfg_key] = dict(config[cfg_key])
 
     return state
 
 
+def _retry_delay(attempt: int) -> float:
+    """Return exponential backoff with jitter before the next mode-change attempt."""
+    delay = min(RETRY_DELAY_MAX, RETRY_DELAY * 2 ** (attempt - 1))
+    return delay * (1 + random.uniform(0, RETRY_DELAY_JITTER))
+
+
+async def _safe_refresh(coordinator: DataUpdateCoordinator, label: str) -> None:
+    """Refresh a coordinator after a mode change, logging (not raising) failures."""
+    try:
+        await coordinator.async_refresh()
+    except Exception as err:
+        _LOGGER.warning("Failed to refresh %s after mode change: %s", label, err)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -57,302 +113,289 @@ async def async_setup_entry(
     """Set up Marstek buttons based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
 
-    entities = []
-
     # Check if multi-device or single-device mode
     if isinstance(coordinator, MarstekMultiDeviceCoordinator):
         # Multi-device mode - create button entities for each device
-        for mac in coordinator.get_device_macs():
-            device_coordinator = coordinator.device_coordinators[mac]
-            device_data = next(d for d in coordinator.devices if (d.get("ble_mac") or d.get("wifi_mac")) == mac)
-
-            entities.extend([
-                MarstekMultiDeviceAutoModeButton(
-                    coordinator=coordinator,
-                    device_coordinator=device_coordinator,
-                    device_mac=mac,
-                    device_data=device_data,
-                ),
-                MarstekMultiDeviceAIModeButton(
-                    coordinator=coordinator,
-                    device_coordinator=device_coordinator,
-                    device_mac=mac,
-                    device_data=device_data,
-                ),
-                MarstekMultiDeviceManualModeButton(
-                    coordinator=coordinator,
-                    device_coordinator=device_coordinator,
-                    device_mac=mac,
-                    device_data=device_data,
-                ),
-            ])
+        async_add_entities(_multi_device_buttons(coordinator))
     else:
         # Single device mode
-        entities.extend([
-            MarstekAutoModeButton(coordinator, entry),
-            MarstekAIModeButton(coordinator, entry),
-            MarstekManualModeButton(coordinator, entry),
-        ])
+        device_mac = entry.data.get("ble_mac") or entry.data.get("wifi_mac")
+        device_info = build_device_info(device_mac, entry.data)
+        async_add_entities(
+            MarstekModeButton(coordinator, device_mac, mode, name, icon, device_info)
+            for mode, name, icon in _MODE_SPECS
+        )
 
-    async_add_entities(entities)
+
+def _multi_device_buttons(
+    coordinator: MarstekMultiDeviceCoordinator,
+) -> Iterator[MarstekMultiDeviceModeButton]:
+    """Yield the mode buttons for every device of a multi-device entry."""
+    for mac in coordinator.get_device_macs():
+        device_coordinator = coordinator.device_coordinators[mac]
+        device_info = coordinator.device_infos[mac]
+
+        for mode, name, icon in _MODE_SPECS:
+            yield MarstekMultiDeviceModeButton(
+                coordinator=coordinator,
+                device_coordinator=device_coordinator,
+                device_mac=mac,
+                mode=mode,
+                name=name,
+                icon=icon,
+                device_info=device_info,
+            )
 
 
 class MarstekModeButton(CoordinatorEntity, ButtonEntity):
-    """Base class for Marstek mode buttons."""
+    """Button that switches a Marstek device to one operating mode."""
+
+    # HA base classes keep a __dict__ for _attr_* values; slot our own state
+    __slots__ = ("_mode", "_cache_debouncer", "_pending_mode_state")
 
     def __init__(
         self,
         coordinator: MarstekDataUpdateCoordinator,
-        entry: ConfigEntry,
-        mode: str,
+        device_mac: str,
+        mode: Mode,
         name: str,
         icon: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
         self._mode = mode
+        self._cache_debouncer: Debouncer | None = None
+        self._pending_mode_state: dict | None = None
         self._attr_has_entity_name = True
-        device_mac = entry.data.get("ble_mac") or entry.data.get("wifi_mac")
-        self._attr_unique_id = f"{device_mac}_{mode.lower()}_mode_button"
+        self._attr_unique_id = f"{device_mac}_{_MODE_LOWER[mode]}_mode_button"
         self._attr_name = name
         self._attr_icon = icon
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_mac)},
-            name=f"Marstek {entry.data['device']}",
-            manufacturer="Marstek",
-            model=entry.data["device"],
-            sw_version=str(entry.data.get("firmware", "Unknown")),
-        )
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data is not None and len(self.coordinator.data) > 0
+        return self.coordinator.has_data
+
+    async def async_added_to_hass(self) -> None:
+        """Set up the cache-update debouncer when added to Home Assistant."""
+        await super().async_added_to_hass()
+        self._cache_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=MODE_CACHE_COOLDOWN,
+            immediate=True,
+            function=self._apply_cached_mode,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending cache update."""
+        if self._cache_debouncer is not None:
+            self._cache_debouncer.async_cancel()
+        await super().async_will_remove_from_hass()
 
     async def async_press(self) -> None:
         """Handle the button press."""
         config = self._build_mode_config()
 
         success = False
-        last_error: str | None = None
-
-        try:
-            # Retry logic
-            for attempt in range(1, MAX_RETRIES + 1):
-                try:
-                    if await self.coordinator.api.set_es_mode(config):
-                        self._update_cached_mode(config)
-                        _LOGGER.info("Successfully set operating mode to %s", self._mode)
-                        success = True
-                        break
-
-                    last_error = "device rejected mode change"
-                    _LOGGER.warning(
-                        "Device rejected mode change to %s (attempt %d/%d)",
-                        self._mode,
-                        attempt,
-                        MAX_RETRIES,
-                    )
-
-                except Exception as err:
-                    last_error = str(err)
-                    _LOGGER.error(
-                        "Error setting mode to %s (attempt %d/%d): %s",
-                        self._mode,
-                        attempt,
-                        MAX_RETRIES,
-                        err,
-                    )
-
-                # Wait before retry (except on last attempt)
-                if attempt < MAX_RETRIES:
-                    await asyncio.sleep(RETRY_DELAY)
-        finally:
-            await self._refresh_mode_data()
+        # Kept as the exception itself; only stringified if the press fails
+        last_error: Exception | str | None = None
+
+        # Retry logic
+        for attempt in range(1, MAX_RETRIES + 1):
+            # Back off before each retry; never after the final attempt
+            if attempt > 1:
+                await asyncio.sleep(_retry_delay(attempt - 1))
+
+            try:
+                if await self.coordinator.api.set_es_mode(config):
+                    self._update_cached_mode(config)
+                    _LOGGER.info("Successfully set operating mode to %s", self._mode.wire)
+                    success = True
+                    break
+
+                last_error = "device rejected mode change"
+                _LOGGER.warning(
+                    "Device rejected mode change to %s (attempt %d/%d)",
+                    self._mode.wire,
+                    attempt,
+                    MAX_RETRIES,
+                )
+
+            except Exception as err:
+                last_error = err
+                _LOGGER.error(
+                    "Error setting mode to %s (attempt %d/%d): %s",
+                    self._mode.wire,
+                    attempt,
+                    MAX_RETRIES,
+                    err,
+                )
 
         if success:
+            # The optimistic cache update already reflects the new mode; the
+            # next scheduled poll confirms it without an extra round-trip
             return
 
+        # Re-read the device so entities don't keep showing a stale mode
+        await self._refresh_mode_data()
+
         _LOGGER.error(
             "Failed to set operating mode to %s after %d attempts",
-            self._mode,
+            self._mode.wire,
             MAX_RETRIES,
         )
-        message = f"Failed to set operating mode to {self._mode}"
+        message = f"Failed to set operating mode to {self._mode.wire}"
         if last_error:
             message = f"{message}: {last_error}"
         raise HomeAssistantError(message)
 
     async def _refresh_mode_data(self) -> None:
         """Force a coordinator refresh so entities reflect the latest state."""
-        try:
-            await self.coordinator.async_refresh()
-        except Exception as err:
-            _LOGGER.warning("Failed to refresh data after mode change: %s", err)
+        await _safe_refresh(self.coordinator, "data")
 
     def _build_mode_config(self) -> dict:
-        """Build configuration for the selected mode."""
-        if self._mode == MODE_AUTO:
-            return {
-                "mode": MODE_AUTO,
-                "auto_cfg": {"enable": 1},
-            }
-        elif self._mode == MODE_AI:
-            return {
-                "mode": MODE_AI,
-                "ai_cfg": {"enable": 1},
-            }
-        elif self._mode == MODE_MANUAL:
-            return {
-                "mode": MODE_MANUAL,
-                "manual_cfg": dict(DEFAULT_MANUAL_MODE_CFG),
-            }
-
-        return {}
+        """Return the configuration payload for the selected mode."""
+        entry = _MODE_TABLE.get(self._mode)
+        return entry[1] if entry is not None else {}
 
     def _update_cached_mode(self, config: dict) -> None:
         """Update coordinator cache so sensors reflect the new mode immediately."""
+        self._pending_mode_state = _mode_state_from_config(self._mode, config)
+        if self._cache_debouncer is None:
+            self._apply_cached_mode()
+        else:
+            self._cache_debouncer.async_schedule_call()
+
+    @callback
+    def _apply_cached_mode(self) -> None:
+        """Push the pending mode state into the coordinator cache."""
+        mode_state = self._pending_mode_state
+        if mode_state is None:
+            return
+        self._pending_mode_state = None
+
         current = self.coordinator.data or {}
-        updated = dict(current)
-        mode_state = _mode_state_from_config(self._mode, config)
-        updated["mode"] = {**(current.get("mode") or {}), **mode_state}
+        updated = current.copy()
+        current_mode = current.get("mode")
+        updated["mode"] = {**current_mode, **mode_state} if current_mode else dict(mode_state)
         self.coordinator.async_set_updated_data(updated)
 
 
-class MarstekAutoModeButton(MarstekModeButton):
-    """Button to switch to Auto mode."""
-
-    def __init__(
-        self,
-        coordinator: MarstekDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the Auto mode button."""
-        super().__init__(coordinator, entry, MODE_AUTO, "Auto mode", "mdi:auto-mode")
-
-
-class MarstekAIModeButton(MarstekModeButton):
-    """Button to switch to AI mode."""
-
-    def __init__(
-        self,
-        coordinator: MarstekDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the AI mode button."""
-        super().__init__(coordinator, entry, MODE_AI, "AI mode", "mdi:brain")
-
-
-class MarstekManualModeButton(MarstekModeButton):
-    """Button to switch to Manual mode."""
-
-    def __init__(
-        self,
-        coordinator: MarstekDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the Manual mode button."""
-        super().__init__(coordinator, entry, MODE_MANUAL, "Manual mode", "mdi:calendar-clock")
-
-
 class MarstekMultiDeviceModeButton(CoordinatorEntity, ButtonEntity):
-    """Base class for Marstek mode buttons in multi-device mode."""
+    """Button that switches one device to an operating mode in multi-device mode."""
+
+    # HA base classes keep a __dict__ for _attr_* values; slot our own state
+    __slots__ = ("device_coordinator", "device_mac", "_mode", "_cache_debouncer", "_pending_mode_state")
 
     def __init__(
         self,
         coordinator: MarstekMultiDeviceCoordinator,
         device_coordinator: MarstekDataUpdateCoordinator,
         device_mac: str,
-        device_data: dict,
-        mode: str,
+        mode: Mode,
         name: str,
         icon: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
         self.device_coordinator = device_coordinator
         self.device_mac = device_mac
         self._mode = mode
+        self._cache_debouncer: Debouncer | None = None
+        self._pending_mode_state: dict | None = None
         self._attr_has_entity_name = True
-        self._attr_unique_id = f"{device_mac}_{mode.lower()}_mode_button"
+        self._attr_unique_id = f"{device_mac}_{_MODE_LOWER[mode]}_mode_button"
         self._attr_name = name
         self._attr_icon = icon
-
-        # Extract last 4 chars of MAC for device name differentiation
-        mac_suffix = device_mac.replace(":", "")[-4:]
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_mac)},
-            name=f"Marstek {device_data.get('device', 'Device')} {mac_suffix}",
-            manufacturer="Marstek",
-            model=device_data.get("device", "Unknown"),
-            sw_version=str(device_data.get("firmware", "Unknown")),
-        )
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        device_data = self.coordinator.get_device_data(self.device_mac)
-        return device_data is not None and len(device_data) > 0
+        return self.coordinator.device_has_data.get(self.device_mac, False)
+
+    async def async_added_to_hass(self) -> None:
+        """Set up the cache-update debouncer when added to Home Assistant."""
+        await super().async_added_to_hass()
+        self._cache_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=MODE_CACHE_COOLDOWN,
+            immediate=True,
+            function=self._apply_cached_mode,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending cache update."""
+        if self._cache_debouncer is not None:
+            self._cache_debouncer.async_cancel()
+        await super().async_will_remove_from_hass()
 
     async def async_press(self) -> None:
         """Handle the button press."""
         config = self._build_mode_config()
 
         success = False
-        last_error: str | None = None
-
-        try:
-            # Retry logic
-            for attempt in range(1, MAX_RETRIES + 1):
-                try:
-                    if await self.device_coordinator.api.set_es_mode(config):
-                        self._update_cached_mode(config)
-                        _LOGGER.info(
-                            "Successfully set operating mode to %s for device %s",
-                            self._mode,
-                            self.device_mac,
-                        )
-                        success = True
-                        break
-
-                    last_error = "device rejected mode change"
-                    _LOGGER.warning(
-                        "Device %s rejected mode change to %s (attempt %d/%d)",
-                        self.device_mac,
-                        self._mode,
-                        attempt,
-                        MAX_RETRIES,
-                    )
-
-                except Exception as err:
-                    last_error = str(err)
-                    _LOGGER.error(
-                        "Error setting mode to %s for device %s (attempt %d/%d): %s",
-                        self._mode,
+        # Kept as the exception itself; only stringified if the press fails
+        last_error: Exception | str | None = None
+
+        # Retry logic
+        for attempt in range(1, MAX_RETRIES + 1):
+            # Back off before each retry; never after the final attempt
+            if attempt > 1:
+                await asyncio.sleep(_retry_delay(attempt - 1))
+
+            try:
+                if await self.device_coordinator.api.set_es_mode(config):
+                    self._update_cached_mode(config)
+                    _LOGGER.info(
+                        "Successfully set operating mode to %s for device %s",
+                        self._mode.wire,
                         self.device_mac,
-                        attempt,
-                        MAX_RETRIES,
-                        err,
                     )
-
-                # Wait before retry (except on last attempt)
-                if attempt < MAX_RETRIES:
-                    await asyncio.sleep(RETRY_DELAY)
-        finally:
-            await self._refresh_mode_data()
+                    success = True
+                    break
+
+                last_error = "device rejected mode change"
+                _LOGGER.warning(
+                    "Device %s rejected mode change to %s (attempt %d/%d)",
+                    self.device_mac,
+                    self._mode.wire,
+                    attempt,
+                    MAX_RETRIES,
+                )
+
+            except Exception as err:
+                last_error = err
+                _LOGGER.error(
+                    "Error setting mode to %s for device %s (attempt %d/%d): %s",
+                    self._mode.wire,
+                    self.device_mac,
+                    attempt,
+                    MAX_RETRIES,
+                    err,
+                )
 
         if success:
+            # The optimistic cache update already reflects the new mode; the
+            # next scheduled poll confirms it without an extra round-trip
             return
 
+        # Re-read the device so entities don't keep showing a stale mode
+        await self._refresh_mode_data()
+
         _LOGGER.error(
             "Failed to set operating mode to %s for device %s after %d attempts",
-            self._mode,
+            self._mode.wire,
             self.device_mac,
             MAX_RETRIES,
         )
         message = (
-            f"Failed to set operating mode to {self._mode} for device {self.device_mac}"
+            f"Failed to set operating mode to {self._mode.wire} for device {self.device_mac}"
         )
         if last_error:
             message = f"{message}: {last_error}"
@@ -360,109 +403,49 @@ class MarstekMultiDeviceModeButton(CoordinatorEntity, ButtonEntity):
 
     async def _refresh_mode_data(self) -> None:
         """Force a refresh on the device and aggregate coordinators."""
-        try:
-            await self.device_coordinator.async_refresh()
-        except Exception as err:
-            _LOGGER.warning(
-                "Failed to refresh device %s data after mode change: %s",
-                self.device_mac,
-                err,
-            )
-
-        try:
-            await self.coordinator.async_refresh()
-        except Exception as err:
-            _LOGGER.warning(
-                "Failed to refresh aggregate data after mode change for %s: %s",
-                self.device_mac,
-                err,
-            )
+        # The two refreshes are independent, so run them concurrently
+        await asyncio.gather(
+            _safe_refresh(self.device_coordinator, f"device {self.device_mac} data"),
+            _safe_refresh(self.coordinator, f"aggregate data for {self.device_mac}"),
+        )
 
     def _build_mode_config(self) -> dict:
-        """Build configuration for the selected mode."""
-        if self._mode == MODE_AUTO:
-            return {
-                "mode": MODE_AUTO,
-                "auto_cfg": {"enable": 1},
-            }
-        elif self._mode == MODE_AI:
-            return {
-                "mode": MODE_AI,
-                "ai_cfg": {"enable": 1},
-            }
-        elif self._mode == MODE_MANUAL:
-            return {
-                "mode": MODE_MANUAL,
-                "manual_cfg": dict(DEFAULT_MANUAL_MODE_CFG),
-            }
-
-        return {}
+        """Return the configuration payload for the selected mode."""
+        entry = _MODE_TABLE.get(self._mode)
+        return entry[1] if entry is not None else {}
 
     def _update_device_cache(self, state: dict) -> dict:
         """Update the per-device coordinator cache and return the new payload."""
         current_device = self.device_coordinator.data or {}
-        updated_device = dict(current_device)
-        updated_device["mode"] = {**(current_device.get("mode") or {}), **state}
+        updated_device = current_device.copy()
+        current_mode = current_device.get("mode")
+        updated_device["mode"] = {**current_mode, **state} if current_mode else dict(state)
         self.device_coordinator.async_set_updated_data(updated_device)
         return updated_device
 
     def _update_cached_mode(self, config: dict) -> None:
         """Update device and aggregate caches so sensors reflect the new mode immediately."""
-        state = _mode_state_from_config(self._mode, config)
+        self._pending_mode_state = _mode_state_from_config(self._mode, config)
+        if self._cache_debouncer is None:
+            self._apply_cached_mode()
+        else:
+            self._cache_debouncer.async_schedule_call()
+
+    @callback
+    def _apply_cached_mode(self) -> None:
+        """Push the pending mode state into the device and aggregate caches."""
+        state = self._pending_mode_state
+        if state is None:
+            return
+        self._pending_mode_state = None
+
         updated_device = self._update_device_cache(state)
 
         current_system = self.coordinator.data or {}
-        devices = dict((current_system.get("devices") or {}))
-        devices[self.device_mac] = updated_device
-
-        updated_system = dict(current_system)
-        updated_system["devices"] = devices
-        self.coordinator.async_set_updated_data(updated_system)
-
-
-class MarstekMultiDeviceAutoModeButton(MarstekMultiDeviceModeButton):
-    """Button to switch to Auto mode in multi-device mode."""
-
-    def __init__(
-        self,
-        coordinator: MarstekMultiDeviceCoordinator,
-        device_coordinator: MarstekDataUpdateCoordinator,
-        device_mac: str,
-        device_data: dict,
-    ) -> None:
-        """Initialize the Auto mode button."""
-        super().__init__(
-            coordinator, device_coordinator, device_mac, device_data, MODE_AUTO, "Auto mode", "mdi:auto-mode"
-        )
-
+        devices = current_system.get("devices")
 
-class MarstekMultiDeviceAIModeButton(MarstekMultiDeviceModeButton):
-    """Button to switch to AI mode in multi-device mode."""
-
-    def __init__(
-        self,
-        coordinator: MarstekMultiDeviceCoordinator,
-        device_coordinator: MarstekDataUpdateCoordinator,
-        device_mac: str,
-        device_data: dict,
-    ) -> None:
-        """Initialize the AI mode button."""
-        super().__init__(
-            coordinator, device_coordinator, device_mac, device_data, MODE_AI, "AI mode", "mdi:brain"
-        )
-
-
-class MarstekMultiDeviceManualModeButton(MarstekMultiDeviceModeButton):
-    """Button to switch to Manual mode in multi-device mode."""
-
-    def __init__(
-        self,
-        coordinator: MarstekMultiDeviceCoordinator,
-        device_coordinator: MarstekDataUpdateCoordinator,
-        device_mac: str,
-        device_data: dict,
-    ) -> None:
-        """Initialize the Manual mode button."""
-        super().__init__(
-            coordinator, device_coordinator, device_mac, device_data, MODE_MANUAL, "Manual mode", "mdi:calendar-clock"
+        updated_system = current_system.copy()
+        updated_system["devices"] = (
+            {**devices, self.device_mac: updated_device} if devices else {self.device_mac: updated_device}
         )
+        self.coordinator.async_set_updated_data(updated_system)
@@ -35,6 +35,7 @@ from __future__ import annotations
 import logging
 import re
 from typing import Any, Final
+from weakref import WeakValueDictionary
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -78,6 +79,27 @@ def get_base_model(device_model: str) -> str:
     return re.sub(r'\s+\d+\.\d+.*$', '', device_model)
 
 
+def _index_by_hardware(
+    matrix: dict[str, dict[tuple[str, int], float]],
+) -> dict[str, dict[str, tuple[tuple[int, float], ...]]]:
+    """Regroup a scaling matrix as {hw_version: {field: ((fw_version, divisor), ...)}}.
+
+    Entries are sorted by firmware version, newest first, so the applicable
+    divisor is the first one whose firmware version is <= the device's.
+    """
+    index: dict[str, dict[str, list[tuple[int, float]]]] = {}
+    for field, scaling_map in matrix.items():
+        for (hw_ver, fw_ver), divisor in scaling_map.items():
+            index.setdefault(hw_ver, {}).setdefault(field, []).append((fw_ver, divisor))
+    return {
+        hw_ver: {
+            field: tuple(sorted(entries, reverse=True))
+            for field, entries in fields.items()
+        }
+        for hw_ver, fields in index.items()
+    }
+
+
 class CompatibilityMatrix:
     """Centralized compatibility matrix for version-dependent value scaling.
 
@@ -153,6 +175,11 @@ class CompatibilityMatrix:
         },
     }
 
+    # SCALING_MATRIX regrouped per hardware version, built once at import
+    _ENTRIES_BY_HW: dict[str, dict[str, tuple[tuple[int, float], ...]]] = _index_by_hardware(
+        SCALING_MATRIX
+    )
+
     def __init__(self, device_model: str, firmware_version: int) -> None:
         """Initialize compatibility matrix for a specific device.
 
@@ -165,18 +192,53 @@ class CompatibilityMatrix:
         self.hardware_version = parse_hardware_version(device_model)
         self.base_model = get_base_model(device_model)
 
+        # Model and firmware are fixed for the lifetime of this object, so
+        # resolve every field's divisor up front instead of on each call.
+        # Fields without an applicable entry are left out (raw value is used).
+        self.divisors: dict[str, float] = {}
+        for field in self.SCALING_MATRIX:
+            divisor = self._resolve_divisor(field)
+            if divisor is not None:
+                self.divisors[field] = divisor
+
         _LOGGER.debug(
             "Initialized compatibility matrix: model=%s, base=%s, hw=%s, fw=%d",
             device_model, self.base_model, self.hardware_version, firmware_version
         )
 
-    def scale_value(self, value: float | None, field: str) -> float | None:
-        """Scale a raw API value based on firmware and hardware version.
+    def _resolve_divisor(self, field: str) -> float | None:
+        """Resolve the divisor for a field on this device.
 
         Lookup logic:
         1. Find all entries for this hardware version and field
         2. Select the highest firmware version <= actual device firmware
-        3. Return scaled value using that divisor
+
+        Returns:
+            The divisor to apply, or None if the raw value should be used as-is.
+        """
+        # Entries for this hardware version, newest firmware first
+        entries = self._ENTRIES_BY_HW.get(self.hardware_version, {}).get(field)
+
+        # If no entries for this hardware version, use raw value
+        if not entries:
+            _LOGGER.debug(
+                "No scaling entries for %s with hw=%s, using raw value",
+                field, self.hardware_version
+            )
+            return None
+
+        # The highest firmware version <= our actual firmware wins
+        for fw_ver, divisor in entries:
+            if fw_ver <= self.firmware_version:
+                return divisor
+
+        # No applicable entry (our FW is older than any defined), use raw value
+        return None
+
+    def scale_value(self, value: float | None, field: str) -> float | None:
+        """Scale a raw API value based on firmware and hardware version.
+
+        Divisors are resolved once per device in __init__ (see _resolve_divisor).
 
         Args:
             value: Raw value from API
@@ -189,43 +251,11 @@ class CompatibilityMatrix:
         if value is None:
             return None
 
-        # If field not in matrix, return raw value (no scaling needed)
-        if field not in self.SCALING_MATRIX:
-            return value
-
-        scaling_map = self.SCALING_MATRIX[field]
-
-        # Find all entries matching our hardware version
-        matching_entries = [
-            (fw_ver, divisor)
-            for (hw_ver, fw_ver), divisor in scaling_map.items()
-            if hw_ver == self.hardware_version
-        ]
-
-        # If no entries for this hardware version, return raw value
-        if not matching_entries:
-            _LOGGER.debug(
-                "No scaling entries for %s with hw=%s, using raw value",
-                field, self.hardware_version
-            )
-            return value
-
-        # Find the highest firmware version <= our actual firmware
-        applicable_entries = [
-            (fw_ver, divisor)
-            for fw_ver, divisor in matching_entries
-            if fw_ver <= self.firmware_version
-        ]
-
-        # If no applicable entry (our FW is older than any defined), return raw value
-        if not applicable_entries:
+        divisor = self.divisors.get(field)
+        if divisor is None:
             return value
 
-        # Get the entry with the highest firmware version
-        selected_fw_ver, divisor = max(applicable_entries, key=lambda x: x[0])
-        scaled = value / divisor
-
-        return scaled
+        return value / divisor
 
     def get_info(self) -> dict[str, Any]:
         """Get compatibility information for diagnostics.
@@ -239,3 +269,18 @@ class CompatibilityMatrix:
             "hardware_version": self.hardware_version,
             "firmware_version": self.firmware_version,
         }
+
+
+# Matrices currently in use, keyed by (device_model, firmware_version). A
+# matrix is read-only once built, so identical devices can share one.
+_MATRICES: WeakValueDictionary[tuple[str, int], CompatibilityMatrix] = WeakValueDictionary()
+
+
+def get_compatibility_matrix(device_model: str, firmware_version: int) -> CompatibilityMatrix:
+    """Return the compatibility matrix for a device, shared with identical devices."""
+    key = (device_model, firmware_version)
+    matrix = _MATRICES.get(key)
+    if matrix is None:
+        matrix = CompatibilityMatrix(device_model=device_model, firmware_version=firmware_version)
+        _MATRICES[key] = matrix
+    return matrix
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -15,9 +16,25 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
+from homeassistant.helpers.storage import Store
 
 from .api import MarstekAPIError, MarstekUDPClient
-from .const import CONF_PORT, DATA_COORDINATOR, DEFAULT_PORT, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_PORT,
+    DATA_COORDINATOR,
+    DEFAULT_PORT,
+    DEFAULT_SCAN_INTERVAL,
+    DISCOVERY_CACHE_KEY,
+    DISCOVERY_CACHE_TTL,
+    DISCOVERY_CACHE_VERSION,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +46,84 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+# Upper bound on waiting for paused/discovery sockets to be released (seconds)
+SOCKET_CLOSE_TIMEOUT = 1.0
+
+
+async def _async_wait_closed(clients: list[MarstekUDPClient]) -> None:
+    """Wait until the sockets closed by these clients are released, up to a bound."""
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(client.wait_closed() for client in clients)),
+            timeout=SOCKET_CLOSE_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        _LOGGER.debug("Timed out waiting for UDP sockets to close")
+
+
+def _coordinator_clients(coordinator: Any) -> list[MarstekUDPClient]:
+    """Return the API clients owned by a single- or multi-device coordinator."""
+    if hasattr(coordinator, "device_coordinators"):
+        return [
+            device_coordinator.api
+            for device_coordinator in coordinator.device_coordinators.values()
+            if device_coordinator.api
+        ]
+    if hasattr(coordinator, "api") and coordinator.api:
+        return [coordinator.api]
+    return []
+
+
+async def _async_pause_clients(clients: list[MarstekUDPClient]) -> None:
+    """Disconnect running clients concurrently so discovery can bind the port."""
+    results = await asyncio.gather(
+        *(client.disconnect() for client in clients), return_exceptions=True
+    )
+    for client, result in zip(clients, results):
+        if isinstance(result, Exception):
+            _LOGGER.warning("Failed to pause client for host %s: %s", client.host, result)
+
+
+async def _async_resume_clients(clients: list[MarstekUDPClient]) -> None:
+    """Reconnect paused clients concurrently after discovery."""
+    _LOGGER.debug("Resuming %d paused API client(s)", len(clients))
+    results = await asyncio.gather(
+        *(client.connect() for client in clients), return_exceptions=True
+    )
+    for client, result in zip(clients, results):
+        if isinstance(result, Exception):
+            _LOGGER.warning("Failed to resume client for host %s: %s", client.host, result)
+
+
+def _discovery_store(hass: HomeAssistant) -> Store:
+    """Return the store holding the last discovery result."""
+    return Store(hass, DISCOVERY_CACHE_VERSION, DISCOVERY_CACHE_KEY)
+
+
+async def _async_load_discovery_cache(hass: HomeAssistant) -> list[dict] | None:
+    """Load the last discovery result, or None if missing or expired."""
+    cached = await _discovery_store(hass).async_load()
+    if not cached:
+        return None
+    if time.time() - cached.get("timestamp", 0) > DISCOVERY_CACHE_TTL:
+        _LOGGER.debug("Cached discovery result expired, rescanning")
+        return None
+    return cached.get("devices") or None
+
+
+async def _async_save_discovery_cache(hass: HomeAssistant, devices: list[dict]) -> None:
+    """Persist a discovery result so the next flow can show it immediately.
+
+    An empty result clears the cache, so devices that are gone are not offered again.
+    """
+    store = _discovery_store(hass)
+    if not devices:
+        await store.async_remove()
+        return
+    # Wall-clock time, since the cache has to survive restarts
+    await store.async_save({"timestamp": time.time(), "devices": devices})
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any], use_ephemeral_port: bool = False) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
@@ -86,89 +181,21 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is None:
-            # Perform discovery
-            # Temporarily disconnect existing integration clients to avoid port conflicts
-            paused_clients = []
-            for entry in self._async_current_entries():
-                if DOMAIN in self.hass.data and entry.entry_id in self.hass.data[DOMAIN]:
-                    coordinator = self.hass.data[DOMAIN][entry.entry_id].get(DATA_COORDINATOR)
-                    if coordinator:
-                        # Handle both single-device and multi-device coordinators
-                        if hasattr(coordinator, 'device_coordinators'):
-                            # Multi-device coordinator
-                            _LOGGER.debug("Pausing multi-device coordinator %s during discovery", entry.title)
-                            for device_coordinator in coordinator.device_coordinators.values():
-                                if device_coordinator.api:
-                                    await device_coordinator.api.disconnect()
-                                    paused_clients.append(device_coordinator.api)
-                        elif hasattr(coordinator, 'api') and coordinator.api:
-                            # Single-device coordinator
-                            _LOGGER.debug("Pausing API client for %s during discovery", entry.title)
-                            await coordinator.api.disconnect()
-                            paused_clients.append(coordinator.api)
-
-            # Wait a bit for disconnections to complete and sockets to close
-            import asyncio
-            await asyncio.sleep(1)
-
-            # Bind to same port as device (required by Marstek protocol)
-            api = MarstekUDPClient(self.hass, port=DEFAULT_PORT, remote_port=DEFAULT_PORT)
-            try:
-                await api.connect()
-                self._discovered_devices = await api.discover_devices()
-                await api.disconnect()
-
-                _LOGGER.info("Discovered %d device(s): %s", len(self._discovered_devices), self._discovered_devices)
-            except Exception as err:
-                _LOGGER.error("Discovery failed: %s", err, exc_info=True)
-                try:
-                    await api.disconnect()
-                except Exception:
-                    pass  # Ignore disconnect errors
+            # Show the previous scan straight away if it is recent enough
+            cached = await _async_load_discovery_cache(self.hass)
+            if cached:
+                _LOGGER.debug("Using %d cached discovered device(s)", len(cached))
+                self._discovered_devices = cached
+                return self._async_show_discovery_form(errors, offer_rescan=True)
+
+            if not await self._async_scan():
                 return await self.async_step_manual()
-            finally:
-                # Wait a bit before resuming to ensure discovery socket is fully closed
-                await asyncio.sleep(1)
-
-                # Resume paused clients
-                for client in paused_clients:
-                    try:
-                        _LOGGER.debug("Resuming paused API client for host %s", client.host)
-                        await client.connect()
-                    except Exception as err:
-                        _LOGGER.warning("Failed to resume client for host %s: %s", client.host, err)
 
             if not self._discovered_devices:
                 # No devices found, offer manual entry
                 return await self.async_step_manual()
 
-            # Build list of discovered devices
-            devices_list = {}
-
-            # Add "All devices" option if multiple devices found
-            if len(self._discovered_devices) > 1:
-                devices_list["__all__"] = f"All devices ({len(self._discovered_devices)} batteries)"
-
-            for device in self._discovered_devices:
-                mac = device["mac"]
-                # Show all devices, the abort happens when user selects one already configured
-                devices_list[mac] = f"{device['name']} ({device['ip']})"
-                _LOGGER.debug("Adding device to list: %s (%s) MAC: %s", device['name'], device['ip'], mac)
-
-            _LOGGER.info("Built device list with %d device(s)", len(devices_list))
-
-            # Add manual entry option
-            devices_list["manual"] = "Manual IP entry"
-
-            return self.async_show_form(
-                step_id="discovery",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required("device"): vol.In(devices_list),
-                    }
-                ),
-                errors=errors,
-            )
+            return self._async_show_discovery_form(errors)
 
         # User selected a device
         selected = user_input["device"]
@@ -176,6 +203,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if selected == "manual":
             return await self.async_step_manual()
 
+        if selected == "rescan":
+            if not await self._async_scan() or not self._discovered_devices:
+                return await self.async_step_manual()
+            return self._async_show_discovery_form(errors)
+
         # Check if user selected "All devices"
         if selected == "__all__":
             # Create multi-device entry using combined BLE MACs for uniqueness
@@ -241,6 +273,95 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    async def _async_scan(self) -> bool:
+        """Run a discovery scan into self._discovered_devices.
+
+        Returns False if discovery itself failed.
+        """
+        # Temporarily disconnect existing integration clients to avoid port conflicts
+        paused_clients = []
+        for entry in self._async_current_entries():
+            if DOMAIN in self.hass.data and entry.entry_id in self.hass.data[DOMAIN]:
+                coordinator = self.hass.data[DOMAIN][entry.entry_id].get(DATA_COORDINATOR)
+                if coordinator:
+                    _LOGGER.debug("Pausing API clients for %s during discovery", entry.title)
+                    paused_clients.extend(_coordinator_clients(coordinator))
+        await _async_pause_clients(paused_clients)
+
+        # Wait for disconnections to complete and sockets to close
+        await _async_wait_closed(paused_clients)
+
+        # Bind to same port as device (required by Marstek protocol)
+        api = MarstekUDPClient(self.hass, port=DEFAULT_PORT, remote_port=DEFAULT_PORT)
+        try:
+            await api.connect()
+            self._discovered_devices = await api.discover_devices()
+            await api.disconnect()
+
+            _LOGGER.info("Discovered %d device(s): %s", len(self._discovered_devices), self._discovered_devices)
+        except Exception as err:
+            _LOGGER.error("Discovery failed: %s", err, exc_info=True)
+            try:
+                await api.disconnect()
+            except Exception:
+                pass  # Ignore disconnect errors
+            return False
+        finally:
+            # Ensure the discovery socket is fully closed before resuming
+            await _async_wait_closed([api])
+
+            # Resume paused clients
+            await _async_resume_clients(paused_clients)
+
+        await _async_save_discovery_cache(self.hass, self._discovered_devices)
+        return True
+
+    def _async_show_discovery_form(
+        self, errors: dict[str, str], offer_rescan: bool = False
+    ) -> FlowResult:
+        """Show the list of discovered devices."""
+        # Build list of discovered devices
+        devices_list = {}
+
+        # Add "All devices" option if multiple devices found
+        if len(self._discovered_devices) > 1:
+            devices_list["__all__"] = f"All devices ({len(self._discovered_devices)} batteries)"
+
+        for device in self._discovered_devices:
+            mac = device["mac"]
+            # Show all devices, the abort happens when user selects one already configured
+            devices_list[mac] = f"{device['name']} ({device['ip']})"
+            _LOGGER.debug("Adding device to list: %s (%s) MAC: %s", device['name'], device['ip'], mac)
+
+        _LOGGER.info("Built device list with %d device(s)", len(devices_list))
+
+        # Results came from the cache; let the user trigger a fresh scan.
+        # Its label comes from the discovery_device selector translations.
+        if offer_rescan:
+            devices_list["rescan"] = "rescan"
+
+        # Add manual entry option
+        devices_list["manual"] = "Manual IP entry"
+
+        return self.async_show_form(
+            step_id="discovery",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("device"): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[
+                                SelectOptionDict(value=value, label=label)
+                                for value, label in devices_list.items()
+                            ],
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key="discovery_device",
+                        )
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
     async def async_step_manual(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -678,19 +799,11 @@ class OptionsFlow(config_entries.OptionsFlow):
         if DOMAIN in self.hass.data:
             for _entry_id, entry_data in self.hass.data[DOMAIN].items():
                 coordinator = entry_data.get(DATA_COORDINATOR)
-                if not coordinator:
-                    continue
-
-                if hasattr(coordinator, "device_coordinators"):
-                    for device_coordinator in coordinator.device_coordinators.values():
-                        if device_coordinator.api:
-                            await device_coordinator.api.disconnect()
-                            paused_clients.append(device_coordinator.api)
-                elif hasattr(coordinator, "api") and coordinator.api:
-                    await coordinator.api.disconnect()
-                    paused_clients.append(coordinator.api)
+                if coordinator:
+                    paused_clients.extend(_coordinator_clients(coordinator))
+        await _async_pause_clients(paused_clients)
 
-        await asyncio.sleep(1)
+        await _async_wait_closed(paused_clients)
 
         api = MarstekUDPClient(self.hass, port=DEFAULT_PORT, remote_port=DEFAULT_PORT)
         try:
@@ -704,13 +817,9 @@ class OptionsFlow(config_entries.OptionsFlow):
             except Exception:  # pylint: disable=broad-except
                 pass
 
-        await asyncio.sleep(1)
+        await _async_wait_closed([api])
 
-        for client in paused_clients:
-            try:
-                await client.connect()
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Failed to resume client during options flow: %s", err)
+        await _async_resume_clients(paused_clients)
 
 
 class CannotConnect(HomeAssistantError):
@@ -1,4 +1,5 @@
 """Constants for the Marstek Local API integration."""
+from enum import IntEnum
 from typing import Final
 
 DOMAIN: Final = "marstek_local_api"
@@ -10,23 +11,36 @@ CONF_PORT: Final = "port"
 DEFAULT_PORT: Final = 30000
 DEFAULT_SCAN_INTERVAL: Final = 60  # Base interval in seconds
 DISCOVERY_TIMEOUT: Final = 9  # Discovery window in seconds
-DISCOVERY_BROADCAST_INTERVAL: Final = 2  # Broadcast every 2 seconds during discovery
+DISCOVERY_BROADCAST_SCHEDULE: Final = (0, 0.5, 1.5)  # Broadcast offsets (s) within the discovery window
+BROADCAST_ADDRESS_CACHE_TTL: Final = 60  # Seconds to reuse resolved broadcast addresses
+DISCOVERY_CACHE_KEY: Final = f"{DOMAIN}.discovery"  # Storage key for the last discovery result
+DISCOVERY_CACHE_VERSION: Final = 1
+DISCOVERY_CACHE_TTL: Final = 24 * 60 * 60  # Seconds before cached discovery results are ignored
 
 # Update intervals (in multiples of base interval)
 UPDATE_INTERVAL_FAST: Final = 1  # ES, Battery status (60s)
 UPDATE_INTERVAL_MEDIUM: Final = 5  # EM, PV, Mode (300s)
 UPDATE_INTERVAL_SLOW: Final = 10  # Device, WiFi, BLE (600s)
+POLL_INTERVAL_JITTER: Final = 0.2  # +/- seconds of random offset on each refresh interval
+POLL_BACKOFF_MAX: Final = 4  # Max multiplier on the refresh interval while a device is unresponsive
+TIER_STRETCH_MAX: Final = 4  # Max multiplier on medium/slow intervals while their data is unchanged
+POLL_IDLE_AFTER: Final = 5  # Refreshes without battery activity before the idle interval applies
+POLL_IDLE_STRETCH: Final = 2  # Multiplier on the refresh interval while the battery is idle (keep below the staleness threshold of 3)
 
 # Communication timeouts
 COMMAND_TIMEOUT: Final = 15  # Timeout for commands in seconds
 MAX_RETRIES: Final = 3  # Maximum retries for critical commands
-RETRY_DELAY: Final = 2  # Delay between retries in seconds
+RETRY_DELAY: Final = 2  # Base delay between retries in seconds (doubles per attempt)
+RETRY_DELAY_MAX: Final = 30  # Upper bound on retry delay
+RETRY_DELAY_JITTER: Final = 0.5  # Up to +50% random jitter on retry delay
 COMMAND_MAX_ATTEMPTS: Final = 3  # Attempts per command before giving up
 COMMAND_BACKOFF_BASE: Final = 1.5  # Base delay for command retry backoff
 COMMAND_BACKOFF_FACTOR: Final = 2.0  # Multiplier for successive backoff delays
 COMMAND_BACKOFF_MAX: Final = 12.0  # Upper bound on backoff delay
 COMMAND_BACKOFF_JITTER: Final = 0.4  # Additional random jitter for backoff
 UNAVAILABLE_THRESHOLD: Final = 120  # Seconds before marking device unavailable
+UDP_RECEIVE_BUFFER_SIZE: Final = 1 << 20  # 1 MiB kernel buffer for bursts of concurrent replies
+UDP_SEND_BUFFER_SIZE: Final = 1 << 18  # 256 KiB, room for a batch of requests and broadcasts
 
 # API Methods
 METHOD_GET_DEVICE: Final = "Marstek.GetDevice"
@@ -71,6 +85,28 @@ MODE_PASSIVE: Final = "Passive"
 
 OPERATING_MODES: Final = [MODE_AUTO, MODE_AI, MODE_MANUAL, MODE_PASSIVE]
 
+
+class Mode(IntEnum):
+    """Operating mode used internally; ``wire`` gives the name the device expects."""
+
+    AUTO = 0
+    AI = 1
+    MANUAL = 2
+    PASSIVE = 3
+
+    @property
+    def wire(self) -> str:
+        """Return the mode name used in JSON-RPC payloads."""
+        return MODE_WIRE_NAMES[self]
+
+
+MODE_WIRE_NAMES: Final = {
+    Mode.AUTO: MODE_AUTO,
+    Mode.AI: MODE_AI,
+    Mode.MANUAL: MODE_MANUAL,
+    Mode.PASSIVE: MODE_PASSIVE,
+}
+
 # Battery states
 BATTERY_STATE_IDLE: Final = "idle"
 BATTERY_STATE_CHARGING: Final = "charging"
@@ -2,32 +2,170 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Mapping
 from datetime import timedelta
 import logging
 import random
+import sys
 import time
-from typing import Any
+from typing import Any, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import MarstekAPIError, MarstekUDPClient
-from .compatibility import CompatibilityMatrix
+from .compatibility import get_compatibility_matrix
 from .const import (
     COMMAND_MAX_ATTEMPTS,
     COMMAND_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DEVICE_MODEL_VENUS_D,
+    DOMAIN,
     UPDATE_INTERVAL_FAST,
     UPDATE_INTERVAL_MEDIUM,
     UPDATE_INTERVAL_SLOW,
     METHOD_BATTERY_STATUS,
     METHOD_ES_STATUS,
+    POLL_BACKOFF_MAX,
+    POLL_IDLE_AFTER,
+    POLL_IDLE_STRETCH,
+    POLL_INTERVAL_JITTER,
+    TIER_STRETCH_MAX,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Firmware/hardware-dependent fields scaled via the compatibility matrix
+_ES_SCALE_FIELDS = (
+    "bat_power",
+    "total_grid_input_energy",
+    "total_grid_output_energy",
+    "total_load_energy",
+)
+_BATTERY_SCALE_FIELDS = ("bat_temp", "bat_capacity", "bat_voltage", "bat_current")
+
+# Shared stand-in for missing data sections so lookups never allocate
+_EMPTY_DICT: dict = {}
+
+# Per-prefix diagnostic keys, in the order _build_command_diagnostics fills them
+_DIAG_KEYS = {
+    prefix: tuple(
+        f"{prefix}_{key}"
+        for key in (
+            "last_latency",
+            "last_attempt",
+            "last_success",
+            "timeout_total",
+            "success_total",
+            "request_total",
+            "success_rate",
+            "last_error",
+        )
+    )
+    for prefix in ("es", "bat")
+}
+
+# Polling tiers: (data category, log label, MarstekUDPClient method, fields to scale)
+_FAST_TIER = (
+    ("es", "ES status", "get_es_status", _ES_SCALE_FIELDS),
+    ("battery", "battery status", "get_battery_status", _BATTERY_SCALE_FIELDS),
+)
+_MEDIUM_TIER = (
+    ("em", "EM status", "get_em_status", ()),
+    ("pv", "PV status", "get_pv_status", ()),  # Venus D only
+    ("mode", "mode status", "get_es_mode", ()),
+)
+_MEDIUM_TIER_NO_PV = tuple(call for call in _MEDIUM_TIER if call[0] != "pv")
+_SLOW_TIER = (
+    ("device", "device info", "get_device_info", ()),
+    ("wifi", "wifi status", "get_wifi_status", ()),
+    ("ble", "BLE status", "get_ble_status", ()),
+)
+# Minimum age (seconds) before slow-tier data is fetched again; device info
+# (model, firmware, MACs) changes far less often than the slow tier runs
+_SLOW_MIN_AGE = {"device": 3600, "wifi": 300, "ble": 600}
+# Device info joins the fast tier on the first update
+_FIRST_TIER = (_SLOW_TIER[0],) + _FAST_TIER
+_MEDIUM_CATEGORIES = frozenset(category for category, *_ in _MEDIUM_TIER)
+# Device data categories read by the multi-device aggregates
+_AGGREGATE_CATEGORIES = ("es", "battery")
+# Commands whose statistics are reported in each poll's diagnostics
+_DIAGNOSTIC_METHODS = (METHOD_ES_STATUS, METHOD_BATTERY_STATUS)
+# Spacing (seconds) between the first requests of devices polled together
+_DEVICE_STAGGER = 0.2
+
+
+def _aggregate_inputs_changed(
+    previous: dict[str, Any] | None, current: dict[str, Any] | None
+) -> bool:
+    """Return True if any category read by the aggregates was replaced."""
+    if previous is current:
+        return False
+    if not previous or not current:
+        return bool(previous) != bool(current)
+    return any(
+        previous.get(category) is not current.get(category)
+        for category in _AGGREGATE_CATEGORIES
+    )
+
+
+async def _update_one(
+    mac: str, coordinator: MarstekDataUpdateCoordinator, not_before: float
+) -> bool:
+    """Update one device of a multi-device system; return whether its aggregate inputs changed.
+
+    The device's first request is held back until the monotonic time
+    ``not_before`` by its client's send pacing, without a separate sleep.
+    The device coordinator's _async_update_data() is called directly and its
+    data attribute set manually, since the multi-device coordinator manages
+    the device coordinators itself. Devices whose own update_interval has not
+    elapsed yet (see MarstekDataUpdateCoordinator.is_poll_due) are skipped.
+    """
+    if not coordinator.is_poll_due(time.monotonic()):
+        return False  # Backing off; the multi-device refresh runs at the base rate
+    previous = coordinator.data
+    coordinator.api.defer_sends(not_before)
+    try:
+        data = await coordinator._async_update_data()
+        coordinator.data = data
+    except (UpdateFailed, MarstekAPIError, OSError, asyncio.TimeoutError) as err:
+        _LOGGER.error("Error updating device %s: %s", mac, err)
+        return False  # Old data is kept on error
+    return _aggregate_inputs_changed(previous, data)
+
+
+def _create_eager_task(coro: Coroutine[Any, Any, _T]) -> asyncio.Task[_T]:
+    """Create a task that starts running immediately where supported (Python 3.12+)."""
+    loop = asyncio.get_running_loop()
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=loop, eager_start=True)
+    return loop.create_task(coro)
+
+
+def build_device_info(
+    mac: str, device_data: Mapping[str, Any], mac_suffix: str | None = None
+) -> DeviceInfo:
+    """Build the DeviceInfo shared by all entities of one device.
+
+    device_data is the config entry data (single-device mode) or the
+    device's entry in the devices list; mac_suffix, if given, tells the
+    devices of a multi-device entry apart in the device name.
+    """
+    name = f"Marstek {device_data.get('device', 'Device')}"
+    if mac_suffix:
+        name = f"{name} {mac_suffix}"
+    return DeviceInfo(
+        identifiers={(DOMAIN, mac)},
+        name=name,
+        manufacturer="Marstek",
+        model=device_data.get("device", "Unknown"),
+        sw_version=str(device_data.get("firmware", "Unknown")),
+    )
+
 
 class MarstekMultiDeviceCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from multiple Marstek devices."""
@@ -42,8 +180,18 @@ class MarstekMultiDeviceCoordinator(DataUpdateCoordinator):
         """Initialize the multi-device coordinator."""
         self.devices = devices
         self.device_coordinators: dict[str, MarstekDataUpdateCoordinator] = {}
-        self.update_count = 1
+        # Last 4 MAC chars per device, used by entities to tell devices apart
+        self.mac_suffixes: dict[str, str] = {}
+        # One DeviceInfo per device, shared by the entities of every platform
+        self.device_infos: dict[str, DeviceInfo] = {}
+        # Per-device "has any data" flags, refreshed whenever listeners are notified
+        self.device_has_data: dict[str, bool] = {}
         self._config_entry = config_entry
+        # (mac, coordinator) pairs polled each refresh; rebuilt by async_setup
+        self._device_items: tuple[tuple[str, MarstekDataUpdateCoordinator], ...] = ()
+        # _device_items snapshot the cached aggregates were computed from
+        self._aggregate_items: tuple[tuple[str, MarstekDataUpdateCoordinator], ...] | None = None
+        self._jitter_cap = min(2.5, max(0.5, scan_interval * 0.1))
 
         super().__init__(
             hass,
@@ -86,6 +234,10 @@ class MarstekMultiDeviceCoordinator(DataUpdateCoordinator):
             )
 
             self.device_coordinators[mac] = coordinator
+            self.mac_suffixes[mac] = mac.replace(":", "")[-4:]
+            self.device_infos[mac] = build_device_info(mac, device_data, self.mac_suffixes[mac])
+
+        self._device_items = tuple(self.device_coordinators.items())
 
     def get_device_macs(self) -> list[str]:
         """Get list of device MACs."""
@@ -97,6 +249,13 @@ class MarstekMultiDeviceCoordinator(DataUpdateCoordinator):
             return self.device_coordinators[mac].data or {}
         return {}
 
+    def async_update_listeners(self) -> None:
+        """Refresh per-device availability flags, then notify listeners."""
+        self.device_has_data = {
+            mac: bool(coordinator.data) for mac, coordinator in self.device_coordinators.items()
+        }
+        super().async_update_listeners()
+
     def _calculate_aggregates(self) -> dict[str, Any]:
         """Calculate aggregate values across all devices."""
         aggregates = {}
@@ -110,139 +269,128 @@ class MarstekMultiDeviceCoordinator(DataUpdateCoordinator):
         if not all_device_data:
             return aggregates
 
+        # Single pass over all devices, accumulating every aggregate at once
+        total_power = power_in = power_out = 0
+        total_rated_capacity = total_remaining_capacity = weighted_soc = 0
+        total_pv_energy = total_grid_import = total_grid_export = total_load_energy = 0
+        total_solar_power = total_grid_power = total_offgrid_power = 0
+        charging_count = discharging_count = 0
+
+        for d in all_device_data:
+            es = d.get("es") or _EMPTY_DICT
+            battery = d.get("battery") or _EMPTY_DICT
+
+            bat_power = es.get("bat_power", 0) or 0
+            total_power += bat_power
+            if bat_power > 0:
+                power_in += bat_power
+                charging_count += 1
+            elif bat_power < 0:
+                power_out -= bat_power
+                discharging_count += 1
+
+            rated_capacity = battery.get("rated_capacity", 0) or 0
+            total_rated_capacity += rated_capacity
+            total_remaining_capacity += battery.get("bat_capacity", 0) or 0
+            weighted_soc += (battery.get("soc", 0) or 0) * rated_capacity
+
+            total_pv_energy += es.get("total_pv_energy", 0) or 0
+            total_grid_import += es.get("total_grid_input_energy", 0) or 0
+            total_grid_export += es.get("total_grid_output_energy", 0) or 0
+            total_load_energy += es.get("total_load_energy", 0) or 0
+            total_solar_power += es.get("pv_power", 0) or 0
+            total_grid_power += es.get("ongrid_power", 0) or 0
+            total_offgrid_power += es.get("offgrid_power", 0) or 0
+
         # Power aggregates
-        total_power = sum(
-            d.get("es", {}).get("bat_power", 0) or 0
-            for d in all_device_data
-        )
         aggregates["total_battery_power"] = total_power
-        aggregates["total_power_in"] = sum(
-            max(0, d.get("es", {}).get("bat_power", 0) or 0)
-            for d in all_device_data
-        )
-        aggregates["total_power_out"] = sum(
-            max(0, -(d.get("es", {}).get("bat_power", 0) or 0))
-            for d in all_device_data
-        )
+        aggregates["total_power_in"] = power_in
+        aggregates["total_power_out"] = power_out
 
         # Capacity aggregates
-        aggregates["total_rated_capacity"] = sum(
-            d.get("battery", {}).get("rated_capacity", 0) or 0
-            for d in all_device_data
-        )
-        aggregates["total_remaining_capacity"] = sum(
-            d.get("battery", {}).get("bat_capacity", 0) or 0
-            for d in all_device_data
-        )
-
-        # Calculate weighted average SOC
-        total_capacity = aggregates["total_rated_capacity"]
-        if total_capacity > 0:
-            weighted_soc = sum(
-                (d.get("battery", {}).get("soc", 0) or 0) *
-                (d.get("battery", {}).get("rated_capacity", 0) or 0)
-                for d in all_device_data
-            )
-            aggregates["average_soc"] = weighted_soc / total_capacity
-        else:
-            aggregates["average_soc"] = None
+        aggregates["total_rated_capacity"] = total_rated_capacity
+        aggregates["total_remaining_capacity"] = total_remaining_capacity
 
-        # Available capacity
-        if total_capacity > 0 and aggregates["average_soc"] is not None:
+        # Calculate weighted average SOC and available capacity
+        if total_rated_capacity > 0:
+            average_soc = weighted_soc / total_rated_capacity
+            aggregates["average_soc"] = average_soc
             aggregates["total_available_capacity"] = (
-                (100 - aggregates["average_soc"]) * total_capacity / 100
+                (100 - average_soc) * total_rated_capacity / 100
             )
         else:
+            aggregates["average_soc"] = None
             aggregates["total_available_capacity"] = None
 
         # Combined state
-        power_values = [
-            d.get("es", {}).get("bat_power", 0) or 0
-            for d in all_device_data
-        ]
-        charging_flags = [p > 0 for p in power_values]
-        discharging_flags = [p < 0 for p in power_values]
-        idle_flags = [p == 0 for p in power_values]
-
-        has_charging = any(charging_flags)
-        has_discharging = any(discharging_flags)
-
-        if has_charging and not has_discharging and all(charging_flags):
+        device_count = len(all_device_data)
+        if charging_count == device_count:
             aggregates["combined_state"] = "charging"
-        elif has_discharging and not has_charging and all(discharging_flags):
+        elif discharging_count == device_count:
             aggregates["combined_state"] = "discharging"
-        elif all(idle_flags):
-            aggregates["combined_state"] = "idle"
-        elif has_charging and has_discharging:
+        elif charging_count and discharging_count:
             aggregates["combined_state"] = "conflicting"
-        elif has_charging:
+        elif charging_count:
             aggregates["combined_state"] = "partly_charging"
-        elif has_discharging:
+        elif discharging_count:
             aggregates["combined_state"] = "partly_discharging"
         else:
             aggregates["combined_state"] = "idle"
 
         # Energy aggregates
-        aggregates["total_pv_energy"] = sum(
-            d.get("es", {}).get("total_pv_energy", 0) or 0
-            for d in all_device_data
-        )
-        aggregates["total_grid_import"] = sum(
-            d.get("es", {}).get("total_grid_input_energy", 0) or 0
-            for d in all_device_data
-        )
-        aggregates["total_grid_export"] = sum(
-            d.get("es", {}).get("total_grid_output_energy", 0) or 0
-            for d in all_device_data
-        )
-        aggregates["total_load_energy"] = sum(
-            d.get("es", {}).get("total_load_energy", 0) or 0
-            for d in all_device_data
-        )
-        aggregates["total_solar_power"] = sum(
-            d.get("es", {}).get("pv_power", 0) or 0
-            for d in all_device_data
-        )
-        aggregates["total_grid_power"] = sum(
-            d.get("es", {}).get("ongrid_power", 0) or 0
-            for d in all_device_data
-        )
-        aggregates["total_offgrid_power"] = sum(
-            d.get("es", {}).get("offgrid_power", 0) or 0
-            for d in all_device_data
-        )
+        aggregates["total_pv_energy"] = total_pv_energy
+        aggregates["total_grid_import"] = total_grid_import
+        aggregates["total_grid_export"] = total_grid_export
+        aggregates["total_load_energy"] = total_load_energy
+        aggregates["total_solar_power"] = total_solar_power
+        aggregates["total_grid_power"] = total_grid_power
+        aggregates["total_offgrid_power"] = total_offgrid_power
 
         return aggregates
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data from all devices."""
-        # Update all device coordinators in parallel
-        # We call _async_update_data() and manually set the data attribute
-        # since we're managing the coordinators directly
-        async def update_device(mac: str, coordinator: MarstekDataUpdateCoordinator):
-            try:
-                await asyncio.sleep(coordinator.poll_jitter)
-                data = await coordinator._async_update_data()
-                coordinator.data = data  # Manually set data since we're calling _async_update_data directly
-                return data
-            except Exception as err:
-                _LOGGER.error("Error updating device %s: %s", mac, err)
-                return coordinator.data  # Return old data on error
-
+        # One jitter sleep for the whole system; devices then start a short
+        # send slot apart instead of each sleeping its own random delay
+        await asyncio.sleep(random.uniform(0.2, self._jitter_cap))
+        start = time.monotonic()
+
+        # Update all device coordinators in parallel (see _update_one).
+        # Eager tasks send their first request right away instead of
+        # waiting a loop iteration to be scheduled.
+        items = self._device_items
         update_tasks = [
-            update_device(mac, coordinator)
-            for mac, coordinator in self.device_coordinators.items()
+            _create_eager_task(_update_one(mac, coordinator, start + index * _DEVICE_STAGGER))
+            for index, (mac, coordinator) in enumerate(items)
         ]
 
-        await asyncio.gather(*update_tasks, return_exceptions=True)
+        results = await asyncio.gather(*update_tasks, return_exceptions=True)
+        # Unexpected errors are not caught per device; report them with their
+        # traceback here so one device's bug doesn't stop the others
+        for (mac, _coordinator), result in zip(items, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Unexpected error updating device %s", mac, exc_info=result)
+        # Anything but an explicit "unchanged" (e.g. an exception) counts as a change
+        any_changed = any(result is not False for result in results)
+
+        # Unchanged device categories keep their object identity between polls
+        # (see _async_poll_tier), so the previous aggregates are still valid
+        # unless a device changed or async_setup rebuilt the device list.
+        if (
+            not any_changed
+            and items is self._aggregate_items
+            and self.data
+            and "aggregates" in self.data
+        ):
+            aggregates = self.data["aggregates"]
+        else:
+            aggregates = self._calculate_aggregates()
+            self._aggregate_items = items
 
         # Build combined data structure
         data = {
-            "devices": {
-                mac: coordinator.data
-                for mac, coordinator in self.device_coordinators.items()
-            },
-            "aggregates": self._calculate_aggregates(),
+            "devices": {mac: coordinator.data for mac, coordinator in items},
+            "aggregates": aggregates,
         }
 
         return data
@@ -251,6 +399,10 @@ class MarstekMultiDeviceCoordinator(DataUpdateCoordinator):
 class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Marstek data from the device."""
 
+    # Staleness tracking settings, shared by all instances
+    STALENESS_THRESHOLD = 3  # missed updates before invalidation
+    STATIC_CATEGORIES = frozenset({"device", "wifi", "ble", "_diagnostic", "aggregates"})
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -266,24 +418,39 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
         self.api = api
         self.firmware_version = firmware_version
         self.device_model = device_model
-        self.update_count = 1  # Start at 1 to skip slow updates on first refresh
-        self.last_message_timestamp: float | None = None
-        jitter_cap = min(2.5, max(0.5, scan_interval * 0.1))
-        self.poll_jitter = random.uniform(0.2, jitter_cap)
-        self._last_update_start: float | None = None
+        self._medium_tier = self._medium_tier_for(device_model)
+        self.update_count = 1  # Polls started, reported in diagnostics
+        # Monotonic deadlines for the medium/slow tiers; medium is due on the
+        # first refresh, both are then scheduled from it (see _async_poll_device)
+        self._medium_due = 0.0
+        self._slow_due: float | None = None
+        # Multipliers on the medium/slow tier intervals, grown while polls return
+        # unchanged data and reset on the first change (see _next_stretch)
+        self._medium_stretch = 1
+        self._slow_stretch = 1
+        self.last_message_monotonic: float | None = None
+        # Configured polling interval; update_interval is this plus jitter
+        self.base_interval = float(scan_interval)
+        self._fail_streak = 0  # Refreshes in a row without any response
+        # Last seen (bat_power, soc) and the monotonic time it last changed;
+        # an idle battery is polled less often (see _is_idle)
+        self._activity: tuple[Any, Any] | None = None
+        self._activity_changed_at = 0.0
+        self._update_lock = asyncio.Lock()  # Serializes polls of this device
+        # Per-prefix (total_attempts, diagnostics) from the last build; stats only
+        # change when a command is attempted (see _build_command_diagnostics)
+        self._command_diagnostics: dict[str, tuple[int, dict[str, Any]]] = {}
+        self._last_update_start: float | None = None  # Monotonic, for interval math
+        self.last_update_started: float | None = None  # Wall-clock timestamp, for diagnostics
         self._config_entry = config_entry
         self._device_mac = device_mac  # Used for multi-device mode to identify which device to update
 
-        # Staleness tracking - track last successful update per category
+        # Staleness tracking - track last successful update per category (monotonic)
         self.category_last_updated: dict[str, float] = {}
-        self.STALENESS_THRESHOLD = 3  # missed updates before invalidation
-        self.STATIC_CATEGORIES = {"device", "wifi", "ble", "_diagnostic", "aggregates"}
 
         # Initialize compatibility matrix for version-specific scaling
-        self.compatibility = CompatibilityMatrix(
-            device_model=device_model,
-            firmware_version=firmware_version,
-        )
+        self.compatibility = get_compatibility_matrix(device_model, firmware_version)
+        self._scalers = self._build_scalers()
 
         super().__init__(
             hass,
@@ -293,6 +460,13 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
         )
         # Default coordinator timeout (10s) is too short for staged polling + retries.
         self._timeout = COMMAND_TIMEOUT * COMMAND_MAX_ATTEMPTS + 5
+        # Whether data is non-empty, refreshed whenever listeners are notified
+        self.has_data = False
+
+    def async_update_listeners(self) -> None:
+        """Refresh the cached has_data flag, then notify listeners."""
+        self.has_data = bool(self.data)
+        super().async_update_listeners()
 
     def _update_device_version(self, device_info: dict) -> None:
         """Update device firmware/hardware version and reinitialize compatibility matrix if changed.
@@ -322,12 +496,11 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
                     new_model,
                 )
                 self.device_model = new_model
+                self._medium_tier = self._medium_tier_for(new_model)
 
             # Reinitialize compatibility matrix with new version(s)
-            self.compatibility = CompatibilityMatrix(
-                device_model=self.device_model,
-                firmware_version=self.firmware_version,
-            )
+            self.compatibility = get_compatibility_matrix(self.device_model, self.firmware_version)
+            self._scalers = self._build_scalers()
 
             # Update config entry data so DeviceInfo shows current firmware/model
             if self._config_entry:
@@ -366,11 +539,16 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
                     self._device_mac or "single-device",
                 )
 
-    def _get_seconds_since_last_message(self) -> int | None:
-        """Get seconds since last successful message (Design Doc §556-576)."""
-        if self.last_message_timestamp is None:
+    @property
+    def last_message_seconds(self) -> int | None:
+        """Seconds since the last successful message (Design Doc §556-576).
+
+        Measured on the monotonic clock so wall-clock jumps (NTP, DST) do not
+        skew it, and computed on read so it keeps counting between polls.
+        """
+        if self.last_message_monotonic is None:
             return None
-        return int(time.time() - self.last_message_timestamp)
+        return int(time.monotonic() - self.last_message_monotonic)
 
     def is_category_fresh(self, category: str) -> bool:
         """Check if category data is fresh enough to display.
@@ -391,53 +569,300 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
 
         # Calculate time since last update
         last_update = self.category_last_updated[category]
-        elapsed = time.time() - last_update
+        elapsed = time.monotonic() - last_update
 
         # Calculate max age (update interval * threshold)
-        max_age = self.update_interval.total_seconds() * self.STALENESS_THRESHOLD
+        interval = self.base_interval
+        max_age = interval * self.STALENESS_THRESHOLD
+        if category in _MEDIUM_CATEGORIES:
+            # Medium-tier data is only refreshed every (possibly stretched) tier period
+            max_age += interval * (UPDATE_INTERVAL_MEDIUM * self._medium_stretch - 1)
 
         return elapsed < max_age
 
+    def is_poll_due(self, now: float) -> bool:
+        """Return whether update_interval has elapsed since the last refresh started.
+
+        Used by the multi-device coordinator, which refreshes every device at
+        the base rate, to honour each device's own (backed-off) interval. Half
+        a base interval of slack absorbs the jitter of both schedules.
+        """
+        if self._last_update_start is None or self.update_interval is None:
+            return True
+        elapsed = now - self._last_update_start
+        return elapsed >= self.update_interval.total_seconds() - self.base_interval / 2
+
+    def _next_update_interval(self, succeeded: bool, idle: bool = False) -> timedelta:
+        """Return the delay until the next refresh.
+
+        Consecutive refreshes without any response double the interval, up to
+        POLL_BACKOFF_MAX times the configured one, so an offline device is not
+        probed at full rate; the first response resets it. The backoff never
+        pushes the next refresh past the point where the last received data
+        goes stale (see is_category_fresh), so sensors still turn unavailable
+        as soon as they would at the base rate. While the battery
+        is idle (see _is_idle) the interval is POLL_IDLE_STRETCH times the
+        configured one. A small random offset keeps this coordinator from
+        firing on the same boundaries as other pollers; the average cadence
+        is unchanged.
+        """
+        if succeeded:
+            self._fail_streak = 0
+        else:
+            self._fail_streak += 1
+        if self._fail_streak:
+            delay = self.base_interval * min(2 ** self._fail_streak, POLL_BACKOFF_MAX)
+            if self.last_message_monotonic is not None:
+                stale_in = (
+                    self.last_message_monotonic
+                    + self.base_interval * self.STALENESS_THRESHOLD
+                    - time.monotonic()
+                )
+                if stale_in >= 0:
+                    delay = min(delay, max(self.base_interval, stale_in))
+        else:
+            delay = self.base_interval * (POLL_IDLE_STRETCH if idle else 1)
+        return timedelta(
+            seconds=delay + random.uniform(-POLL_INTERVAL_JITTER, POLL_INTERVAL_JITTER)
+        )
+
     def _build_command_diagnostics(self, prefix: str, stats: dict[str, Any] | None) -> dict[str, Any]:
-        """Transform command stats into diagnostic fields."""
+        """Transform command stats into diagnostic fields.
+
+        Every attempt bumps total_attempts, so the previous result is returned
+        as long as that counter has not moved. The result must not be mutated.
+        """
         if not stats:
             return {}
 
-        total_attempts = stats.get("total_attempts", 0)
-        total_success = stats.get("total_success", 0)
-        total_timeouts = stats.get("total_timeouts", 0)
+        total_attempts = stats["total_attempts"]
+        cached = self._command_diagnostics.get(prefix)
+        if cached is not None and cached[0] == total_attempts:
+            return cached[1]
+
+        # The client always records every counter, so they are read directly
+        total_success = stats["total_success"]
         success_rate = (
             (total_success / total_attempts) * 100 if total_attempts else None
         )
 
         last_success = stats.get("last_success")
-        diag: dict[str, Any] = {
-            f"{prefix}_last_latency": stats.get("last_latency"),
-            f"{prefix}_last_attempt": stats.get("last_attempt"),
-            f"{prefix}_last_success": None if last_success is None else int(bool(last_success)),
-            f"{prefix}_timeout_total": total_timeouts,
-            f"{prefix}_success_total": total_success,
-            f"{prefix}_request_total": total_attempts,
-            f"{prefix}_success_rate": success_rate,
-            f"{prefix}_last_error": stats.get("last_error"),
-        }
+        diag: dict[str, Any] = dict(
+            zip(
+                _DIAG_KEYS[prefix],
+                (
+                    stats.get("last_latency"),
+                    stats.get("last_attempt"),
+                    None if last_success is None else int(bool(last_success)),
+                    stats["total_timeouts"],
+                    total_success,
+                    total_attempts,
+                    success_rate,
+                    stats.get("last_error"),
+                ),
+            )
+        )
+        self._command_diagnostics[prefix] = (total_attempts, diag)
         return diag
 
+    def _build_scalers(self) -> dict[str, tuple[tuple[str, float], ...]]:
+        """Pair each polled category's scaled fields with this device's divisors.
+
+        Rebuilt whenever the compatibility matrix is; fields without a divisor
+        keep their raw value and are left out.
+        """
+        divisors = self.compatibility.divisors
+        scalers: dict[str, tuple[tuple[str, float], ...]] = {}
+        for category, _label, _method, fields in _FAST_TIER + _MEDIUM_TIER + _SLOW_TIER:
+            pairs = tuple((field, divisors[field]) for field in fields if field in divisors)
+            if pairs:
+                scalers[category] = pairs
+        return scalers
+
+    @staticmethod
+    def _apply_scaling(status: dict[str, Any], scalers: tuple[tuple[str, float], ...]) -> None:
+        """Scale firmware-dependent fields of a status payload in place."""
+        for field, divisor in scalers:
+            value = status.get(field)
+            if value is not None:
+                status[field] = value / divisor
+
+    def _is_idle(self, data: dict[str, Any], now: float) -> bool:
+        """Track battery activity and return whether the battery is idle.
+
+        The battery counts as idle when it is neither charging nor discharging
+        and its power and SOC have not changed for POLL_IDLE_AFTER refresh
+        intervals. Any change ends the idle period immediately.
+
+        The stretched interval also applies per device in multi-device mode
+        (see is_poll_due). It delays every tier, so the data age reported by
+        last_message_seconds grows to about POLL_IDLE_STRETCH intervals and
+        medium/slow tiers run up to one idle interval past their deadline;
+        fast-tier data stays within the STALENESS_THRESHOLD window as long as
+        POLL_IDLE_STRETCH is below it.
+        """
+        es = data.get("es") or _EMPTY_DICT
+        activity = (es.get("bat_power"), (data.get("battery") or _EMPTY_DICT).get("soc"))
+        if activity != self._activity:
+            self._activity = activity
+            self._activity_changed_at = now
+            return False
+        if activity[0]:
+            return False
+        return now - self._activity_changed_at >= self.base_interval * POLL_IDLE_AFTER
+
+    @staticmethod
+    def _next_stretch(stretch: int, succeeded: bool, changed: bool) -> int:
+        """Return the next interval multiplier for a slow-moving polling tier.
+
+        Each poll that returns only unchanged data doubles the multiplier, up
+        to TIER_STRETCH_MAX; any change snaps back to the nominal interval.
+        Failed polls keep the current multiplier so outages don't stretch it.
+        """
+        if not succeeded:
+            return stretch
+        if changed:
+            return 1
+        return min(stretch * 2, TIER_STRETCH_MAX)
+
+    @staticmethod
+    def _medium_tier_for(device_model: str) -> tuple[tuple[str, str, str, tuple[str, ...]], ...]:
+        """Return the medium polling tier for a model; only query PV for Venus D."""
+        if device_model == DEVICE_MODEL_VENUS_D:
+            return _MEDIUM_TIER
+        return _MEDIUM_TIER_NO_PV
+
+    def _due_slow_calls(
+        self, now: float, slack: float
+    ) -> tuple[tuple[str, str, str, tuple[str, ...]], ...]:
+        """Return the slow-tier calls whose data is older than its floor age.
+
+        The same slack as the tier deadlines applies, so data fetched on the
+        previous slow poll a few seconds into that tick still counts as due.
+        """
+        due = []
+        for call in _SLOW_TIER:
+            last = self.category_last_updated.get(call[0])
+            if last is None or now - last >= _SLOW_MIN_AGE[call[0]] - slack:
+                due.append(call)
+        return tuple(due)
+
+    async def _async_poll_tier(
+        self,
+        tier: tuple[tuple[str, str, str, tuple[str, ...]], ...],
+        updates: dict[str, Any],
+        delay: float,
+        kwargs: dict[str, Any],
+    ) -> tuple[bool, bool]:
+        """Fetch one polling tier, storing payloads that differ from self.data in updates.
+
+        Returns (succeeded, changed): whether any call succeeded and whether any
+        returned payload differs from the previous refresh.
+        """
+        previous = self.data or _EMPTY_DICT
+        results = await self._async_fetch_tier(
+            [(label, getattr(self.api, method)) for _category, label, method, _fields in tier],
+            delay,
+            kwargs,
+        )
+
+        # One clock read for everything this tier received
+        received = time.monotonic()
+        success = False
+        changed = False
+        for (category, _label, _method, _fields), result in zip(tier, results):
+            if not result:
+                continue
+            # Looked up per result: device info earlier in the tier may have
+            # changed the firmware/model and rebuilt the scalers
+            scalers = self._scalers.get(category)
+            if scalers:
+                # Scale firmware/hardware-dependent values
+                self._apply_scaling(result, scalers)
+            # Keep the previous object when nothing changed so unchanged
+            # sections stay identical (``is``) across refreshes
+            if result != previous.get(category):
+                changed = True
+                updates[category] = result
+            self.category_last_updated[category] = received
+            if category == "device":
+                self._update_device_version(result)
+            success = True
+        if success:
+            self.last_message_monotonic = received
+        return success, changed
+
+    async def _async_fetch_tier(
+        self,
+        calls: Iterable[tuple[str, Callable[..., Awaitable[Any]]]],
+        delay: float,
+        kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Run one polling tier's requests concurrently.
+
+        The client spaces request starts ``delay`` apart to keep pacing the
+        device (see MarstekUDPClient.send_interval), but responses are awaited
+        together (matched by message id) instead of one round-trip after
+        another. Failed requests yield None.
+        """
+        calls = list(calls)
+        self.api.send_interval = delay
+
+        # Eager tasks run up to their first await right away, so send slots
+        # are reserved in tier order and a request whose slot has already
+        # arrived is sent without waiting a loop cycle
+        results = await asyncio.gather(
+            *(_create_eager_task(fetch(**kwargs)) for _label, fetch in calls),
+            return_exceptions=True,
+        )
+
+        # Failures are routine (timeouts); skip the logging call entirely unless debugging
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        values: list[Any] = []
+        for (label, _fetch), result in zip(calls, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                if debug:
+                    _LOGGER.debug("Failed to get %s: %s", label, result)
+                result = None
+            values.append(result)
+        return values
+
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from API, never running two polls of this device at once.
+
+        A poll that overruns (slow device, retries) can overlap the next
+        scheduled refresh or a manual one; the overlapping call keeps the
+        current data instead of sending a second round of requests.
+        """
+        if self._update_lock.locked() and self.data is not None:
+            _LOGGER.debug("Previous update of %s still running, keeping current data", self.name)
+            return self.data
+        async with self._update_lock:
+            return await self._async_poll_device()
+
+    async def _async_poll_device(self) -> dict[str, Any]:
         """Fetch data from API with tiered polling strategy."""
         try:
-            update_started = time.time()
+            tick_started = time.monotonic()
             actual_interval = None
             if self._last_update_start is not None:
-                actual_interval = update_started - self._last_update_start
-            self._last_update_start = update_started
+                actual_interval = tick_started - self._last_update_start
+            self._last_update_start = tick_started
+            self.last_update_started = time.time()
 
             # Check if this is truly the first update (never been run before)
             is_first_update = self.data is None
-            _LOGGER.debug("Update starting - is_first_update=%s, self.data=%s", is_first_update, "None" if self.data is None else f"dict with {len(self.data)} keys")
+            _LOGGER.debug(
+                "Update starting - is_first_update=%s, previous keys=%s",
+                is_first_update,
+                None if is_first_update else len(self.data),
+            )
 
-            # Start with previous data to preserve values on partial failures
-            data = dict(self.data) if self.data else {}
+            # Only changed categories are collected here; they are merged over
+            # the previous data (preserving values on partial failures) at the end
+            updates: dict[str, Any] = {}
             had_success = False
 
             def _command_kwargs() -> dict[str, Any]:
@@ -450,155 +875,68 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
                 """Back off a little between calls; go faster while probing initial contact."""
                 return 0.2 if is_first_update and not had_success else 1.0
 
-            if is_first_update:
-                _LOGGER.debug("First update - fetching device info")
-                try:
-                    await asyncio.sleep(_command_delay())  # Delay before first API call
-                    device_info = await self.api.get_device_info(**_command_kwargs())
-                    if device_info:
-                        data["device"] = device_info
-                        self.category_last_updated["device"] = time.time()
-                        self._update_device_version(device_info)
-                        had_success = True
-                except Exception as err:
-                    _LOGGER.warning("Failed to get device info on first update: %s", err)
-
             # High priority - every update (~60s)
-            # ES.GetStatus and Bat.GetStatus for real-time power/energy data
-            try:
-                await asyncio.sleep(_command_delay())  # Delay between API calls
-                es_status = await self.api.get_es_status(**_command_kwargs())
-            except Exception as err:
-                _LOGGER.debug("Failed to get ES status: %s", err)
-                es_status = None
-
-            if es_status:
-                # Scale firmware-dependent values
-                if "bat_power" in es_status:
-                    es_status["bat_power"] = self.compatibility.scale_value(
-                        es_status["bat_power"], "bat_power"
-                    )
-                if "total_grid_input_energy" in es_status:
-                    es_status["total_grid_input_energy"] = self.compatibility.scale_value(
-                        es_status["total_grid_input_energy"], "total_grid_input_energy"
-                    )
-                if "total_grid_output_energy" in es_status:
-                    es_status["total_grid_output_energy"] = self.compatibility.scale_value(
-                        es_status["total_grid_output_energy"], "total_grid_output_energy"
-                    )
-                if "total_load_energy" in es_status:
-                    es_status["total_load_energy"] = self.compatibility.scale_value(
-                        es_status["total_load_energy"], "total_load_energy"
-                    )
-
-                data["es"] = es_status
-                self.category_last_updated["es"] = time.time()
+            # ES.GetStatus and Bat.GetStatus for real-time power/energy data.
+            # The first update also fetches device info in the same batch.
+            if is_first_update:
+                _LOGGER.debug("First update - fetching device info with fast tier")
+            succeeded, _changed = await self._async_poll_tier(
+                _FIRST_TIER if is_first_update else _FAST_TIER,
+                updates,
+                _command_delay(),
+                _command_kwargs(),
+            )
+            if succeeded:
                 had_success = True
 
-            try:
-                await asyncio.sleep(_command_delay())  # Delay between API calls
-                battery_status = await self.api.get_battery_status(**_command_kwargs())
-            except Exception as err:
-                _LOGGER.debug("Failed to get battery status: %s", err)
-                battery_status = None
-
-            if battery_status:
-                # Scale firmware/hardware-dependent values
-                if "bat_temp" in battery_status:
-                    battery_status["bat_temp"] = self.compatibility.scale_value(
-                        battery_status["bat_temp"], "bat_temp"
-                    )
-                if "bat_capacity" in battery_status:
-                    battery_status["bat_capacity"] = self.compatibility.scale_value(
-                        battery_status["bat_capacity"], "bat_capacity"
-                    )
-                if "bat_voltage" in battery_status:
-                    battery_status["bat_voltage"] = self.compatibility.scale_value(
-                        battery_status["bat_voltage"], "bat_voltage"
-                    )
-                if "bat_current" in battery_status:
-                    battery_status["bat_current"] = self.compatibility.scale_value(
-                        battery_status["bat_current"], "bat_current"
-                    )
-                data["battery"] = battery_status
-                self.category_last_updated["battery"] = time.time()
-                had_success = True
+            # Tier deadlines are measured from the start of this tick. Half an
+            # interval of slack keeps poll jitter from pushing a tier back a tick.
+            interval = self.base_interval
+            slack = interval / 2
+            first_tick = self._slow_due is None
+            if first_tick:
+                self._slow_due = tick_started + interval * (UPDATE_INTERVAL_SLOW - 1) - slack
 
             # Medium priority - every 5th update (~300s)
             # EM, PV, Mode - slower-changing data
-            run_medium = self.update_count == 1 or self.update_count % UPDATE_INTERVAL_MEDIUM == 0
+            run_medium = tick_started >= self._medium_due
             if is_first_update and not had_success:
                 run_medium = False
             if run_medium:
-                try:
-                    await asyncio.sleep(_command_delay())  # Delay between API calls
-                    em_status = await self.api.get_em_status(**_command_kwargs())
-                    if em_status:
-                        data["em"] = em_status
-                        self.category_last_updated["em"] = time.time()
-                        had_success = True
-                except Exception as err:
-                    _LOGGER.debug("Failed to get EM status: %s", err)
-
-                # Only query PV for Venus D
-                if self.device_model == DEVICE_MODEL_VENUS_D:
-                    try:
-                        await asyncio.sleep(_command_delay())  # Delay between API calls
-                        pv_status = await self.api.get_pv_status(**_command_kwargs())
-                        if pv_status:
-                            data["pv"] = pv_status
-                            self.category_last_updated["pv"] = time.time()
-                            had_success = True
-                    except Exception as err:
-                        _LOGGER.debug("Failed to get PV status: %s", err)
-
-                try:
-                    await asyncio.sleep(_command_delay())  # Delay between API calls
-                    mode_status = await self.api.get_es_mode(**_command_kwargs())
-                    if mode_status:
-                        data["mode"] = mode_status
-                        self.category_last_updated["mode"] = time.time()
-                        had_success = True
-                except Exception as err:
-                    _LOGGER.debug("Failed to get mode status: %s", err)
+                succeeded, changed = await self._async_poll_tier(
+                    self._medium_tier, updates, _command_delay(), _command_kwargs()
+                )
+                if succeeded:
+                    had_success = True
+                self._medium_stretch = self._next_stretch(self._medium_stretch, succeeded, changed)
+                self._medium_due = (
+                    tick_started + interval * UPDATE_INTERVAL_MEDIUM * self._medium_stretch - slack
+                )
+            if first_tick:
+                # Same phase as the former update counter (medium on updates
+                # 1, 5, 10, ...): the second medium poll is one interval early
+                self._medium_due = tick_started + interval * (UPDATE_INTERVAL_MEDIUM - 1) - slack
 
             # Low priority - every 10th update (~600s)
             # Device, WiFi, BLE - static/diagnostic data
-            run_slow = self.update_count % UPDATE_INTERVAL_SLOW == 0
+            run_slow = tick_started >= self._slow_due
             if is_first_update and not had_success:
                 run_slow = False
             if run_slow:
-                try:
-                    await asyncio.sleep(_command_delay())  # Delay between API calls
-                    device_info = await self.api.get_device_info(**_command_kwargs())
-                    if device_info:
-                        data["device"] = device_info
-                        self.category_last_updated["device"] = time.time()
-                        self._update_device_version(device_info)
-                        had_success = True
-                except Exception as err:
-                    _LOGGER.debug("Failed to get device info: %s", err)
-
-                try:
-                    await asyncio.sleep(_command_delay())  # Delay between API calls
-                    wifi_status = await self.api.get_wifi_status(**_command_kwargs())
-                    if wifi_status:
-                        data["wifi"] = wifi_status
-                        self.category_last_updated["wifi"] = time.time()
-                        had_success = True
-                except Exception as err:
-                    _LOGGER.debug("Failed to get wifi status: %s", err)
-
-                try:
-                    await asyncio.sleep(_command_delay())  # Delay between API calls
-                    ble_status = await self.api.get_ble_status(**_command_kwargs())
-                    if ble_status:
-                        data["ble"] = ble_status
-                        self.category_last_updated["ble"] = time.time()
+                # Skip slow-tier calls whose data is younger than its floor age
+                slow_tier = self._due_slow_calls(tick_started, slack)
+                if slow_tier:
+                    succeeded, changed = await self._async_poll_tier(
+                        slow_tier, updates, _command_delay(), _command_kwargs()
+                    )
+                    if succeeded:
                         had_success = True
-                except Exception as err:
-                    _LOGGER.debug("Failed to get BLE status: %s", err)
-
+                    self._slow_stretch = self._next_stretch(self._slow_stretch, succeeded, changed)
+                # Rescheduled even when every call was skipped, so the calls
+                # keep the slow-tier cadence instead of firing as floors expire
+                self._slow_due = (
+                    tick_started + interval * UPDATE_INTERVAL_SLOW * self._slow_stretch - slack
+                )
             # Increment update counter
             self.update_count += 1
 
@@ -609,44 +947,53 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator):
                     "First update did not receive any data from device; continuing setup and retrying in background"
                 )
 
-            # If we got any new data, update the last message timestamp
-            # (We compare with the preserved old data to see if anything changed)
+            # Merge this tick's changes over the previous data
+            data = {**self.data, **updates} if self.data else updates
+
+            # last_message_monotonic is stamped per tier in _async_poll_tier
             if had_success:
-                self.last_message_timestamp = time.time()
-                _LOGGER.debug("Updated data - at least one API call succeeded (keys: %s)", list(data.keys()))
+                _LOGGER.debug("Updated data - at least one API call succeeded (keys: %s)", data.keys())
             else:
                 _LOGGER.debug(
                     "No fresh data this update - all API calls may have timed out, keeping previous values (keys: %s)",
-                    list(data.keys()),
+                    data.keys(),
                 )
 
-            # Add diagnostic data (will be recalculated on sensor access)
-            es_stats = self.api.get_command_stats(METHOD_ES_STATUS)
-            bat_stats = self.api.get_command_stats(METHOD_BATTERY_STATUS)
-            target_interval = (
-                self.update_interval.total_seconds() if self.update_interval else None
-            )
-
+            # Snapshot diagnostic data for this tick (the last-message sensor
+            # reads last_message_seconds live instead)
+            stats = self.api.get_command_stats_for(_DIAGNOSTIC_METHODS)
             diagnostic_data = {
-                "last_message_seconds": self._get_seconds_since_last_message(),
-                "target_interval": target_interval,
+                "last_message_seconds": self.last_message_seconds,
+                "target_interval": self.base_interval,
                 "actual_interval": actual_interval,
             }
-            diagnostic_data.update(self._build_command_diagnostics("es", es_stats))
-            diagnostic_data.update(self._build_command_diagnostics("bat", bat_stats))
+            diagnostic_data.update(
+                self._build_command_diagnostics("es", stats[METHOD_ES_STATUS])
+            )
+            diagnostic_data.update(
+                self._build_command_diagnostics("bat", stats[METHOD_BATTERY_STATUS])
+            )
 
             data["_diagnostic"] = diagnostic_data
 
+            self.update_interval = self._next_update_interval(
+                had_success, self._is_idle(data, tick_started)
+            )
+
             return data
 
         except MarstekAPIError as err:
+            self.update_interval = self._next_update_interval(False)
             # Only fail if this is the first update (no existing data to preserve)
             if is_first_update:
                 raise UpdateFailed(f"Error communicating with API: {err}") from err
             # Otherwise log and return preserved data
             _LOGGER.warning("API error during update, keeping old values: %s", err)
             return self.data if self.data else {}
-        except Exception as err:
+        except (OSError, ValueError, asyncio.TimeoutError) as err:
+            # Socket and payload errors only; cancellation and programming errors
+            # propagate so HA can shut down cleanly and report real bugs.
+            self.update_interval = self._next_update_interval(False)
             # Only fail if this is the first update (no existing data to preserve)
             if is_first_update:
                 raise UpdateFailed(f"Unexpected error: {err}") from err
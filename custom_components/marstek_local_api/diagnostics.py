@@ -65,7 +65,7 @@ def _coordinator_snapshot(coordinator: MarstekDataUpdateCoordinator) -> dict[str
         "device_name": coordinator.name,
         "update_interval": update_interval,
         "update_count": coordinator.update_count,
-        "last_update_started": coordinator._last_update_start,  # pylint: disable=protected-access
+        "last_update_started": coordinator.last_update_started,
 
         # Current sensor data
         "sensor_data": coordinator.data,
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -27,7 +28,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DATA_COORDINATOR, DEVICE_MODEL_VENUS_D, DOMAIN
-from .coordinator import MarstekDataUpdateCoordinator, MarstekMultiDeviceCoordinator
+from .coordinator import (
+    MarstekDataUpdateCoordinator,
+    MarstekMultiDeviceCoordinator,
+    build_device_info,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +44,8 @@ class MarstekSensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[dict], any] | None = None
     available_fn: Callable[[dict], bool] | None = None
     category: str | None = None
+    # Read the value from the device coordinator instead of its data dict
+    coordinator_value_fn: Callable[[MarstekDataUpdateCoordinator], Any] | None = None
 
 
 def _wh_to_kwh(value: float | int | None) -> float | None:
@@ -363,7 +370,7 @@ SENSOR_TYPES: tuple[MarstekSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.SECONDS,
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("_diagnostic", {}).get("last_message_seconds"),
+        coordinator_value_fn=lambda coordinator: coordinator.last_message_seconds,
         category="_diagnostic",
     ),
     # Operating mode
@@ -557,7 +564,7 @@ async def async_setup_entry(
         # Multi-device mode - create sensors for each device + aggregate sensors
         for mac in coordinator.get_device_macs():
             device_coordinator = coordinator.device_coordinators[mac]
-            device_data = next(d for d in coordinator.devices if (d.get("ble_mac") or d.get("wifi_mac")) == mac)
+            device_info = coordinator.device_infos[mac]
 
             # Add standard sensors for this device
             for description in SENSOR_TYPES:
@@ -567,7 +574,7 @@ async def async_setup_entry(
                         device_coordinator=device_coordinator,
                         entity_description=description,
                         device_mac=mac,
-                        device_data=device_data,
+                        device_info=device_info,
                     )
                 )
 
@@ -580,7 +587,7 @@ async def async_setup_entry(
                             device_coordinator=device_coordinator,
                             entity_description=description,
                             device_mac=mac,
-                            device_data=device_data,
+                            device_info=device_info,
                         )
                     )
 
@@ -601,13 +608,17 @@ async def async_setup_entry(
 
     else:
         # Single device mode (legacy)
+        device_mac = entry.data.get("ble_mac") or entry.data.get("wifi_mac")
+        device_info = build_device_info(device_mac, entry.data)
+
         # Add standard sensors
         for description in SENSOR_TYPES:
             entities.append(
                 MarstekSensor(
                     coordinator=coordinator,
                     entity_description=description,
-                    entry=entry,
+                    device_mac=device_mac,
+                    device_info=device_info,
                 )
             )
 
@@ -618,7 +629,8 @@ async def async_setup_entry(
                     MarstekSensor(
                         coordinator=coordinator,
                         entity_description=description,
-                        entry=entry,
+                        device_mac=device_mac,
+                        device_info=device_info,
                     )
                 )
 
@@ -634,25 +646,22 @@ class MarstekSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: MarstekDataUpdateCoordinator,
         entity_description: MarstekSensorEntityDescription,
-        entry: ConfigEntry,
+        device_mac: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._attr_has_entity_name = True
-        device_mac = entry.data.get("ble_mac") or entry.data.get("wifi_mac")
         self._attr_unique_id = f"{device_mac}_{entity_description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_mac)},
-            name=f"Marstek {entry.data['device']}",
-            manufacturer="Marstek",
-            model=entry.data["device"],
-            sw_version=str(entry.data.get("firmware", "Unknown")),
-        )
+        self._attr_device_info = device_info
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
+        if self.entity_description.coordinator_value_fn:
+            return self.entity_description.coordinator_value_fn(self.coordinator)
+
         if not self.entity_description.value_fn:
             return None
 
@@ -683,7 +692,7 @@ class MarstekMultiDeviceSensor(CoordinatorEntity, SensorEntity):
         device_coordinator: MarstekDataUpdateCoordinator,
         entity_description: MarstekSensorEntityDescription,
         device_mac: str,
-        device_data: dict,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -692,21 +701,14 @@ class MarstekMultiDeviceSensor(CoordinatorEntity, SensorEntity):
         self.device_mac = device_mac
         self._attr_has_entity_name = True
         self._attr_unique_id = f"{device_mac}_{entity_description.key}"
-
-        # Extract last 4 chars of MAC for device name differentiation
-        mac_suffix = device_mac.replace(":", "")[-4:]
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_mac)},
-            name=f"Marstek {device_data.get('device', 'Device')} {mac_suffix}",
-            manufacturer="Marstek",
-            model=device_data.get("device", "Unknown"),
-            sw_version=str(device_data.get("firmware", "Unknown")),
-        )
+        self._attr_device_info = device_info
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
+        if self.entity_description.coordinator_value_fn:
+            return self.entity_description.coordinator_value_fn(self.device_coordinator)
+
         if not self.entity_description.value_fn:
             return None
 